@@ -0,0 +1,33 @@
+from timeit import timeit
+from pymba import Vimba
+
+
+# a feature present on most cameras, change as required
+FEATURE_NAME = 'Width'
+NUM_READS = 1000
+
+
+def uncached_read(camera, feature_name: str):
+    # how attribute reads used to resolve, listing and decoding every feature on each access
+    if feature_name in list(vmb_feature_info.name.decode()
+                            for vmb_feature_info in camera._feature_infos()):
+        return camera.feature(feature_name).value
+
+
+def cached_read(camera, feature_name: str):
+    return getattr(camera, feature_name)
+
+
+if __name__ == '__main__':
+
+    with Vimba() as vimba:
+        camera = vimba.camera(0)
+        camera.open()
+
+        print('{} features'.format(len(camera.feature_names())))
+
+        for read in (uncached_read, cached_read):
+            seconds = timeit(lambda: read(camera, FEATURE_NAME), number=NUM_READS)
+            print('{}: {:.1f} us per read'.format(read.__name__, seconds / NUM_READS * 1e6))
+
+        camera.close()
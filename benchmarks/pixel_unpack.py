@@ -0,0 +1,24 @@
+from timeit import timeit
+import numpy as np
+from pymba.pixel_unpack import unpack_10p, unpack_12p, unpack_12packed
+
+
+# a typical large sensor, change as required
+WIDTH = 4096
+HEIGHT = 3000
+NUM_UNPACKS = 20
+
+
+if __name__ == '__main__':
+
+    num_pixels = WIDTH * HEIGHT
+    out = np.empty((HEIGHT, WIDTH), dtype=np.uint16)
+
+    for unpack, bits in ((unpack_10p, 10), (unpack_12p, 12), (unpack_12packed, 12)):
+        packed = np.random.randint(0, 256, -(-num_pixels * bits // 8), dtype=np.uint8)
+
+        for name, kwargs in (('new array', {}), ('out', {'out': out})):
+            seconds = timeit(lambda: unpack(packed, num_pixels, **kwargs), number=NUM_UNPACKS)
+            print('{} ({}): {:.0f} MB/s packed, {:.1f} ms per frame'.format(
+                unpack.__name__, name, packed.nbytes * NUM_UNPACKS / seconds / 1e6,
+                seconds / NUM_UNPACKS * 1e3))
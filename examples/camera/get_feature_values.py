@@ -0,0 +1,17 @@
+from pymba import Vimba
+
+
+if __name__ == '__main__':
+
+    with Vimba() as vimba:
+        camera = vimba.camera(0)
+        camera.open()
+
+        # read all readable feature values in one pass
+        for feature_name, value in camera.get_features().items():
+            print(feature_name, value)
+
+        # or just a selection of them
+        print(camera.get_features(['Width', 'Height', 'PixelFormat']))
+
+        camera.close()
@@ -0,0 +1,15 @@
+from pymba import Vimba, typed_camera
+
+
+if __name__ == '__main__':
+
+    with Vimba() as vimba:
+        camera = vimba.camera(0)
+        camera.open()
+
+        # features of the typed camera are real properties, use it in place of the camera
+        camera = typed_camera(camera)
+        print(type(camera).__name__)
+        print(camera.Width, camera.Height)
+
+        camera.close()
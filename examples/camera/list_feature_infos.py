@@ -7,8 +7,10 @@ if __name__ == '__main__':
         camera = vimba.camera(0)
         camera.open()
 
-        for feature_name in camera.feature_names():
-            feature = camera.feature(feature_name)
-            print(feature.info)
+        # list feature infos category by category using the indexed feature tree
+        feature_tree = camera.feature_tree()
+        for category in feature_tree.categories():
+            for feature_name in feature_tree.category_names(category):
+                print(feature_tree.info(feature_name))
 
         camera.close()
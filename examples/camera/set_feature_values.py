@@ -0,0 +1,22 @@
+from pymba import Vimba
+
+
+if __name__ == '__main__':
+
+    with Vimba() as vimba:
+        camera = vimba.camera(0)
+        camera.open()
+
+        # features are written in dependency order, unchanged values are skipped and all writes
+        # are rolled back if any of them fails
+        camera.set_features({
+            'Width': 640,
+            'Height': 480,
+            'OffsetX': 0,
+            'OffsetY': 0,
+            'PixelFormat': 'Mono8',
+        })
+
+        print(camera.get_features(['Width', 'Height', 'OffsetX', 'OffsetY', 'PixelFormat']))
+
+        camera.close()
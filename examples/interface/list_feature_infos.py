@@ -7,8 +7,10 @@ if __name__ == '__main__':
         interface = vimba.interface(0)
         interface.open()
 
-        for feature_name in interface.feature_names():
-            feature = interface.feature(feature_name)
-            print(feature.info)
+        # list feature infos category by category using the indexed feature tree
+        feature_tree = interface.feature_tree()
+        for category in feature_tree.categories():
+            for feature_name in feature_tree.category_names(category):
+                print(feature_tree.info(feature_name))
 
         interface.close()
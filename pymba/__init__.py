@@ -1,4 +1,9 @@
 from .vimba import Vimba, VimbaException
-from .frame import Frame
+from .frame import Frame, FrameView, StreamDescriptor
+from .frame_allocator import FrameAllocator, DefaultFrameAllocator, MmapFrameAllocator, \
+    UserFrameAllocator, FrameBufferPool
+from .feature_cache import FeatureCache
+from .typed_camera_gen import typed_camera
+from .feature_commands import run_feature_commands_async
 
 __version__ = '0.3.7'
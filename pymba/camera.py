@@ -1,10 +1,14 @@
 from ctypes import byref, sizeof, c_uint32
-from typing import Optional, List, Callable
-import gc
+from typing import Optional, List, Callable, Dict, Any
 
 from .vimba_object import VimbaObject
 from .vimba_exception import VimbaException
-from .frame import Frame
+from .feature import Feature, _FEATURE_DATA_COMMAND, _FEATURE_DATA_RAW, _FEATURE_DATA_NONE, \
+    _FEATURE_DATA_UNKNOWN, _FEATURE_FLAGS_READ, _FEATURE_FLAGS_VOLATILE
+from .frame import Frame, StreamDescriptor, _stride
+from .frame_allocator import FrameAllocator, FrameBufferPool
+from .register_space import RegisterSpace
+from . import feature_cache as _feature_cache
 from . import vimba_c
 
 
@@ -76,9 +80,23 @@ class Camera(VimbaObject):
 
         self._frame_buffer = ()
 
+        # frame buffers kept across arm cycles for the allocator of the last arm, and that
+        # allocator
+        self._frame_buffer_pool: Optional[FrameBufferPool] = None
+        self._frame_buffer_allocator: Optional[FrameAllocator] = None
+
         # user registered callback function
         self._user_callback = None
 
+        # C frame callback shared by all frames, created on first use, and the frames it may be
+        # called for by address
+        self._frame_callback_wrapper_c = None
+        self._frames_by_address: Dict[int, Frame] = {}
+
+        # cached feature values and an invalidation count per watched feature, None if disabled
+        self._feature_value_cache: Optional[Dict[str, Any]] = None
+        self._feature_value_cache_invalidations: Dict[str, int] = {}
+
     @property
     def handle(self):
         return self._handle
@@ -96,11 +114,14 @@ class Camera(VimbaObject):
 
     def open(self,
              camera_access_mode: Optional[int] = VimbaObject.VMB_ACCESS_MODE_FULL,
-             adjust_packet_size: Optional[bool] = True):
+             adjust_packet_size: Optional[bool] = True,
+             feature_cache: Optional['_feature_cache.FeatureCache'] = None):
         """
         Open the camera with requested access mode. Adjusts packet size by default.
         :param camera_access_mode: Access mode to open the camera in.
         :param adjust_packet_size: Adjust packet size for GigE cameras.
+        :param feature_cache: On disk cache to restore the camera's feature table from, or to
+        store it in if not yet cached.
         """
         error = vimba_c.vmb_camera_open(self.camera_id.encode(),
                                         camera_access_mode,
@@ -108,6 +129,12 @@ class Camera(VimbaObject):
         if error:
             raise VimbaException(error)
 
+        # features may differ between connections, e.g. after a firmware update
+        self._reset_feature_cache()
+
+        if feature_cache is not None and not feature_cache.restore(self):
+            feature_cache.store(self)
+
         # may experience issues with ethernet commands if not called
         if adjust_packet_size:
             try:
@@ -120,12 +147,113 @@ class Camera(VimbaObject):
         """
         Close the camera.
         """
-        self.unregister_all_feature_invalidation_callbacks()
+        self.unwatch_all_features()
+        self._shutdown_async_requests()
+        self.unsubscribe_all_feature_invalidations()
+        self._remove_all_feature_invalidation_listeners()
+        self._clear_feature_value_cache()
 
         error = vimba_c.vmb_camera_close(self._handle)
         if error:
             raise VimbaException(error)
 
+        self._reset_feature_cache()
+
+    def enable_feature_value_cache(self) -> None:
+        """
+        Answer feature attribute reads from memory where possible. Each feature is watched for
+        invalidation events from the first time it is read, and its cached value is discarded
+        whenever the camera reports that it changed, so the cache stays coherent with the camera.
+        Volatile features, which may change without an invalidation event (e.g.
+        DeviceTemperature), are never cached.
+        """
+        if self._feature_value_cache is None:
+            self._feature_value_cache = {}
+
+    def disable_feature_value_cache(self) -> None:
+        """
+        Stop caching feature values and stop watching features for invalidation.
+        """
+        for feature_name in self._feature_value_cache_invalidations:
+            self._remove_feature_invalidation_listener(feature_name,
+                                                       self._invalidate_feature_value)
+        self._clear_feature_value_cache()
+        self._feature_value_cache = None
+
+    def _clear_feature_value_cache(self) -> None:
+        """
+        Forget all cached feature values and watched features, leaving the cache enabled or
+        disabled.
+        """
+        if self._feature_value_cache is not None:
+            self._feature_value_cache = {}
+        self._feature_value_cache_invalidations = {}
+
+    def _invalidate_feature_value(self, feature_name: str) -> None:
+        """
+        Called on the Vimba callback thread when a watched feature is invalidated.
+        """
+        # nothing is cached yet if the feature is still being watched
+        if feature_name not in self._feature_value_cache_invalidations:
+            return
+        self._feature_value_cache_invalidations[feature_name] += 1
+        if self._feature_value_cache is not None:
+            self._feature_value_cache.pop(feature_name, None)
+
+    def _get_feature_value(self, feature_name: str, feature: Feature):
+        cache = self._feature_value_cache
+        if cache is None:
+            return feature.value
+
+        try:
+            return cache[feature_name]
+        except KeyError:
+            pass
+
+        info = feature.info
+        if info.featureFlags & _FEATURE_FLAGS_VOLATILE or \
+                not info.featureFlags & _FEATURE_FLAGS_READ or \
+                info.featureDataType in (_FEATURE_DATA_UNKNOWN, _FEATURE_DATA_COMMAND,
+                                         _FEATURE_DATA_RAW, _FEATURE_DATA_NONE):
+            return feature.value
+
+        # watch the feature before reading it so that no invalidation can be missed, and only
+        # cache it once it is watched
+        if feature_name not in self._feature_value_cache_invalidations:
+            try:
+                self._add_feature_invalidation_listener(feature_name,
+                                                        self._invalidate_feature_value)
+            except VimbaException:
+                return feature.value
+            self._feature_value_cache_invalidations[feature_name] = 0
+
+        # don't cache the value if it was invalidated while being read
+        invalidations = self._feature_value_cache_invalidations[feature_name]
+        value = feature.value
+        if self._feature_value_cache_invalidations.get(feature_name) == invalidations:
+            cache[feature_name] = value
+
+        return value
+
+    def _set_feature_value(self, feature_name: str, feature: Feature, value) -> None:
+        feature.value = value
+
+        # the camera may adjust the written value so don't assume it, read it again when needed
+        if feature_name in self._feature_value_cache_invalidations:
+            self._invalidate_feature_value(feature_name)
+
+    def register_space(self, address: int, size: int, page_size: Optional[int] = 4096,
+                       max_cached_pages: Optional[int] = 16) -> RegisterSpace:
+        """
+        Get a bytes like, sliceable view over a region of the camera's memory that is read and
+        written in blocks. See RegisterSpace.
+        :param address: the start address of the region.
+        :param size: the size of the region in bytes.
+        :param page_size: the size of each block read from the camera.
+        :param max_cached_pages: the maximum number of blocks to keep cached.
+        """
+        return RegisterSpace(self, address, size, page_size, max_cached_pages)
+
     def revoke_all_frames(self):
         """
         Revoke all frames assigned to the camera.
@@ -158,15 +286,53 @@ class Camera(VimbaObject):
         if error:
             raise VimbaException(error)
 
-    def new_frame(self) -> Frame:
+    def _frame_callback_c(self, frame: Frame):
+        """
+        Gets the C frame callback to queue a frame with, which calls the frame's callback.
+        :param frame: the frame being queued.
+        """
+        self._frames_by_address[frame._address] = frame
+
+        if self._frame_callback_wrapper_c is None:
+            frames_by_address = self._frames_by_address
+
+            def frame_callback_wrapper(camera_handle, frame_address: int):
+                frame = frames_by_address.get(frame_address)
+                if frame is not None and frame._frame_callback is not None:
+                    frame._frame_callback(frame)
+
+            # keep a reference to prevent gc issues
+            self._frame_callback_wrapper_c = vimba_c.vmb_frame_callback_func(frame_callback_wrapper)
+
+        return self._frame_callback_wrapper_c
+
+    def new_frame(self, stream: Optional[StreamDescriptor] = None) -> Frame:
         """
         Creates and returns a new frame object. Multiple frames per camera can therefore be
         returned.
+        :param stream: the geometry of the camera's frames, see stream_descriptor. Read from the
+        camera when needed if not given.
+        """
+        return Frame(self, stream)
+
+    def stream_descriptor(self) -> StreamDescriptor:
+        """
+        Get the geometry of the frames the camera currently streams, reading the features
+        involved in a single pass.
         """
-        return Frame(self)
+        values = self.get_features(('PayloadSize', 'PixelFormat', 'Width', 'Height'))
+
+        # a payload size is required, read it on its own to raise the reason it's unavailable
+        payload_size = values['PayloadSize'] if 'PayloadSize' in values else self.PayloadSize
+
+        pixel_format = values.get('PixelFormat')
+        width = values.get('Width')
+        return StreamDescriptor(payload_size, pixel_format, width, values.get('Height'),
+                                _stride(pixel_format, width))
 
     def arm(self, mode: str, callback: Optional[Callable] = None,
-            frame_buffer_size: Optional[int] = 10) -> None:
+            frame_buffer_size: Optional[int] = 10,
+            allocator: Optional[FrameAllocator] = None) -> None:
         """
         Arm the camera by starting the capture engine and creating frames.
         :param mode: Either 'SingleFrame' to acquire a single frame or 'Continuous' for streaming
@@ -180,6 +346,10 @@ class Camera(VimbaObject):
         :param frame_buffer_size: number of frames to create and use for the acquisition buffer.
         Applies to 'Continuous' acquisition mode only. Increasing this may help if frames are being
         dropped.
+        :param allocator: allocator of the frame buffers, e.g. a MmapFrameAllocator for page
+        aligned buffers. Defaults to a DefaultFrameAllocator. The buffers of the last arm are kept
+        and reused by the next arm with the same allocator, unless the allocator isn't pooled,
+        see clear_frame_buffer_pools.
         """
         if self._is_armed:
             raise VimbaException(VimbaException.ERR_INVALID_CAMERA_MODE)
@@ -194,11 +364,26 @@ class Camera(VimbaObject):
         self.AcquisitionMode = mode
         self._acquisition_mode = mode
 
-        # create frame buffer and announce frames to camera
-        self._frame_buffer = tuple(self.new_frame()
+        # only keep the buffers of one allocator
+        if self._frame_buffer_pool is None or allocator is not self._frame_buffer_allocator:
+            self.clear_frame_buffer_pools()
+            self._frame_buffer_allocator = allocator
+            if allocator is None or allocator.pooled:
+                self._frame_buffer_pool = FrameBufferPool(allocator)
+        frame_allocator = allocator if self._frame_buffer_pool is None \
+            else self._frame_buffer_pool
+
+        # create frame buffer and announce frames to camera, sharing the stream geometry
+        stream = self.stream_descriptor()
+        self._frame_buffer = tuple(self.new_frame(stream)
                                    for _ in range(frame_buffer_size))
         for frame in self._frame_buffer:
-            frame.announce()
+            frame.announce(allocator=frame_allocator)
+
+        # drop buffers left over from previous arms, e.g. of a different size after an ROI change,
+        # so that the pool never holds more than the buffers of the current arm
+        if self._frame_buffer_pool is not None:
+            self._frame_buffer_pool.clear()
 
         self.start_capture()
 
@@ -278,10 +463,23 @@ class Camera(VimbaObject):
         self.flush_capture_queue()
         self.revoke_all_frames()
 
+        # keep the buffers for the next arm
+        for frame in self._frame_buffer:
+            if frame._memory is not None:
+                frame._invalidate_views()
+                if self._frame_buffer_pool is not None:
+                    self._frame_buffer_pool.release(frame._memory, frame._payload_size)
         self._frame_buffer = ()
+        self._frames_by_address.clear()
 
-        # encourage garbage collection of frame buffer memory
-        gc.collect()
+    def clear_frame_buffer_pools(self) -> None:
+        """
+        Drop the frame buffers kept for reuse by later arms so that their memory can be freed.
+        """
+        if self._frame_buffer_pool is not None:
+            self._frame_buffer_pool.clear()
+        self._frame_buffer_pool = None
+        self._frame_buffer_allocator = None
 
     def load_settings(self, filepath, iterations) -> None:
         """
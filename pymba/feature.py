@@ -1,5 +1,6 @@
-from ctypes import byref, sizeof, c_uint32, c_double, c_char_p, c_bool, c_int64, create_string_buffer
-from typing import Union, Tuple, List, Callable
+from ctypes import byref, sizeof, c_uint32, c_double, c_char_p, c_bool, c_int64, c_char, \
+    create_string_buffer
+from typing import Union, Tuple, List, Callable, Optional, Dict, Any
 
 from .vimba_exception import VimbaException
 from . import vimba_c
@@ -17,10 +18,95 @@ from . import vimba_c
     _FEATURE_DATA_NONE,
 ) = range(9)
 
+# out parameter types used to get the value of each data type
+_DATA_TYPE_TO_CTYPE = {
+    _FEATURE_DATA_INT: c_int64,
+    _FEATURE_DATA_FLOAT: c_double,
+    _FEATURE_DATA_ENUM: c_char_p,
+    _FEATURE_DATA_BOOL: c_bool,
+    # number of bytes filled, the value itself is returned in a buffer
+    _FEATURE_DATA_STRING: c_uint32,
+    _FEATURE_DATA_RAW: c_uint32,
+}
+
+# initial string buffer size for bulk reads, grown when a longer string is read
+_STRING_BUFFER_SIZE = 256
+
+# VmbFeatureFlagsType
+_FEATURE_FLAGS_READ = 1
+_FEATURE_FLAGS_WRITE = 2
+_FEATURE_FLAGS_VOLATILE = 8
+_FEATURE_FLAGS_MODIFY_WRITE = 16
+
+# client side handling of int and float values set, see Feature.limit_mode
+_LIMIT_MODES = (None, 'check', 'clamp')
+
+# marks a cached range or increment that is not yet known
+_NOT_CACHED = object()
+
+
+def _string_get(handle, name: bytes, buffer, size_filled: c_uint32) -> Tuple[int, Any]:
+    """
+    Get the value of a string feature into a string buffer. If the buffer is too small it is
+    replaced by one of the required size. Returns the error code and the buffer holding the value.
+    :param handle: handle of the Vimba object the feature belongs to.
+    :param name: name of the feature.
+    :param buffer: string buffer to try first.
+    :param size_filled: out parameter for the number of bytes filled.
+    """
+    error = vimba_c.vmb_feature_string_get(handle, name, buffer, len(buffer), byref(size_filled))
+    if error == VimbaException.ERR_DATA_TOO_LARGE:
+        # query the required size, including the terminating null
+        error = vimba_c.vmb_feature_string_get(handle, name, None, 0, byref(size_filled))
+        if not error:
+            buffer = create_string_buffer(size_filled.value)
+            error = vimba_c.vmb_feature_string_get(handle, name, buffer, len(buffer),
+                                                   byref(size_filled))
+    return error, buffer
+
+
+def _read_values(handle, data_type: int, names: List[str], values: Dict[str, Any]) -> None:
+    """
+    Read the values of many features of the same data type into a dict, reusing a single out
+    parameter for all of them. Features whose data type has no value, or which fail to be read,
+    are skipped.
+    :param handle: handle of the Vimba object the features belong to.
+    :param data_type: Data type as defined in VmbFeatureDataType, shared by all the features.
+    :param names: names of the features to read.
+    :param values: dict to add the feature values to.
+    """
+    if data_type == _FEATURE_DATA_STRING:
+        buffer = create_string_buffer(_STRING_BUFFER_SIZE)
+        size_filled = c_uint32()
+        for name in names:
+            error, buffer = _string_get(handle, name.encode(), buffer, size_filled)
+            if not error:
+                values[name] = buffer.value.decode()
+        return
+
+    get_funcs = {
+        _FEATURE_DATA_INT: vimba_c.vmb_feature_int_get,
+        _FEATURE_DATA_FLOAT: vimba_c.vmb_feature_float_get,
+        _FEATURE_DATA_ENUM: vimba_c.vmb_feature_enum_get,
+        _FEATURE_DATA_BOOL: vimba_c.vmb_feature_bool_get,
+    }
+    if data_type not in get_funcs:
+        return
+
+    get_func = get_funcs[data_type]
+    value = _DATA_TYPE_TO_CTYPE[data_type]()
+    value_ref = byref(value)
+    for name in names:
+        if not get_func(handle, name.encode(), value_ref):
+            # enum values are returned as bytes
+            values[name] = value.value.decode() if data_type == _FEATURE_DATA_ENUM \
+                else value.value
+
 
 class Feature:
     """
-    A feature of a Vimba object.
+    A feature of a Vimba object. The feature's info is queried once and the access functions
+    matching its data type are bound when the feature is created.
     """
 
     @property
@@ -29,83 +115,192 @@ class Feature:
 
     @property
     def info(self) -> vimba_c.VmbFeatureInfo:
-        return self._feature_info()
+        return self._info
 
     @property
-    def value(self) -> Union[str, int, float, bool]:
-        return self._access_func('get', self.info.featureDataType)()
+    def value(self) -> Union[str, int, float, bool, bytearray]:
+        """
+        The value of the feature. Raw features are returned as a bytearray and may be set from
+        any object supporting the buffer protocol, e.g. bytes, memoryview or a NumPy array.
+        """
+        return self._getter()
 
     @value.setter
-    def value(self, value: Union[str, int, float, bool]) -> None:
-        self._access_func('set', self.info.featureDataType)(value)
+    def value(self, value) -> None:
+        self._setter(value)
 
     @property
     def range(self) -> Union[None, Tuple[int, int], Tuple[float, float], Tuple[str, str]]:
+        """
+        The range of the feature. Ranges of features belonging to a Vimba object are cached until
+        the feature is invalidated, except for volatile features.
+        """
         # only some types actually have a range
-        if self.info.featureDataType in (_FEATURE_DATA_INT,
-                                         _FEATURE_DATA_FLOAT,
-                                         _FEATURE_DATA_ENUM):
-            return self._access_func('range', self.info.featureDataType)()
-        return None
+        if self._range_query is None:
+            return None
+        return self._cached_limit('_cached_range', self._range_query)
 
     @property
     def increment(self) -> Union[None, int, float]:
+        """
+        The increment of the feature, cached in the same way as its range.
+        """
         # only some types actually have an increment
-        if self.info.featureDataType in (_FEATURE_DATA_INT,
-                                         _FEATURE_DATA_FLOAT):
-            return self._access_func('increment', self.info.featureDataType)()
-        return None
+        if self._increment_query is None:
+            return None
+        increment = self._cached_limit('_cached_increment', self._query_increment)
+        if isinstance(increment, VimbaException):
+            raise VimbaException(increment.error_code)
+        return increment
+
+    @property
+    def limit_mode(self) -> Optional[str]:
+        """
+        How int and float values are checked against the feature's range and increment before
+        being set. None sends values to the camera as is. 'check' rejects invalid values without
+        a round trip to the camera, and 'clamp' clamps values to the range and snaps them to the
+        nearest increment. Limits are queried again before a value is rejected or adjusted, so
+        stale limits never cause a valid value to be changed. Setting values via a
+        FeatureAccessor bypasses the limit mode.
+        """
+        return self._limit_mode
+
+    @limit_mode.setter
+    def limit_mode(self, limit_mode: Optional[str]) -> None:
+        if limit_mode not in _LIMIT_MODES:
+            raise ValueError('Limit mode must be one of {}.'.format(_LIMIT_MODES))
+        self._limit_mode = limit_mode
+
+    @property
+    def int_value(self) -> int:
+        """
+        The value of an enum feature as the integer value of its current entry. Entries are
+        mapped using the feature's entry table, which is queried once and then cached.
+        """
+        self._require_enum()
+        entry = self._get_enum()
+        entries = self._enum_table()[0]
+        if entry in entries:
+            return entries[entry]
+        return self._enum_as_int(entry)
+
+    @int_value.setter
+    def int_value(self, value: int) -> None:
+        self._require_enum()
+        entry_names = self._enum_table()[1]
+        if value in entry_names:
+            self._set_enum(entry_names[value])
+        else:
+            self._set_enum(self._enum_as_string(value))
+
+    @property
+    def enum_entries(self) -> Dict[str, int]:
+        """
+        The entries of an enum feature and their integer values.
+        """
+        self._require_enum()
+        return dict(self._enum_table()[0])
+
+    @property
+    def affected_feature_names(self) -> List[str]:
+        """
+        Names of the features whose value, range or availability may change when this feature
+        is written.
+        """
+        if self._affected_feature_names is None:
+            self._affected_feature_names = self._list_related(vimba_c.vmb_feature_list_affected) \
+                if self._info.hasAffectedFeatures else []
+        return self._affected_feature_names
+
+    @property
+    def selected_feature_names(self) -> List[str]:
+        """
+        Names of the features selected by this feature, if it is a selector.
+        """
+        if self._selected_feature_names is None:
+            self._selected_feature_names = self._list_related(vimba_c.vmb_feature_list_selected) \
+                if self._info.hasSelectedFeatures else []
+        return self._selected_feature_names
 
-    def __init__(self, name, handle):
+    def __init__(self, name: str, handle, info: Optional[vimba_c.VmbFeatureInfo] = None,
+                 watch: Optional[Callable[[str, Callable[[str], None]], None]] = None):
+        """
+        :param name: name of the feature.
+        :param handle: handle of the Vimba object the feature belongs to.
+        :param info: info of the feature if already known, otherwise it is queried.
+        :param watch: function to add a listener for invalidation of the feature, e.g. the Vimba
+        object's _add_feature_invalidation_listener. Range and increment are only cached if given.
+        """
         self._name = name.encode()
         self._handle = handle
-
-    def _access_func(self, func_type: str, data_type: int) -> Callable:
+        self._info = self._feature_info() if info is None else info
+
+        # range and increment, cached while the feature isn't invalidated
+        self._watch = watch
+        self._limits_watched = False
+        self._limits_generation = 0
+        self._cached_range = _NOT_CACHED
+        self._cached_increment = _NOT_CACHED
+        self._limit_mode = None
+        self._limited_set_in_progress = False
+
+        # preallocated out parameters, reused by every get of the feature
+        data_type = self._info.featureDataType
+        self._value_c = _DATA_TYPE_TO_CTYPE[data_type]() if data_type in _DATA_TYPE_TO_CTYPE \
+            else None
+        self._value_ref = None if self._value_c is None else byref(self._value_c)
+
+        # sized from the feature's maximum string length on first use
+        self._string_buffer = None
+
+        self._getter, self._setter, self._range_query, self._increment_query = \
+            self._access_funcs(data_type)
+
+        # static relations to other features, listed on first use
+        self._affected_feature_names = None
+        self._selected_feature_names = None
+
+        # enum entries as (entry to int, int to entry) tables, queried on first use
+        self._enum_tables: Optional[Tuple[Dict[str, int], Dict[int, str]]] = None
+        self._enum_entries_decoded: Dict[bytes, str] = {}
+
+    def _access_funcs(self, data_type: int) -> Tuple[Callable, Callable, Optional[Callable],
+                                                     Optional[Callable]]:
         """
-        Get the correct function needed to access the feature attribute based on the feature's data
-        type.
-        :param func_type: One of 'get', 'set', 'range', 'increment'.
+        Get the (getter, setter, range, increment) functions needed to access the feature based
+        on the feature's data type. Range and increment functions are None for data types that
+        don't have them.
         :param data_type: Data type as defined in VmbFeatureDataType.
         """
-        # (getter, setter, range) funcs
-        access_funcs = {
-            _FEATURE_DATA_UNKNOWN: (),
-            _FEATURE_DATA_INT: (self._get_int,
-                                self._set_int,
-                                self._range_query_int,
-                                self._increment_query_int),
-            _FEATURE_DATA_FLOAT: (self._get_float,
-                                  self._set_float,
-                                  self._range_query_float,
-                                  self._increment_query_float),
-            _FEATURE_DATA_ENUM: (self._get_enum,
-                                 self._set_enum,
-                                 self._range_query_enum),
-            _FEATURE_DATA_STRING: (self._get_string,
-                                   self._set_string),
-            _FEATURE_DATA_BOOL: (self._get_bool,
-                                 self._set_bool),
-            _FEATURE_DATA_COMMAND: (),
-            _FEATURE_DATA_RAW: (),
-            _FEATURE_DATA_NONE: (),
-        }
-
-        access_indices = {
-            'get': 0,
-            'set': 1,
-            'range': 2,
-            'increment': 3,
-        }
+        if data_type == _FEATURE_DATA_INT:
+            return (self._get_int, self._set_int_limited, self._range_query_int,
+                    self._increment_query_int)
+        if data_type == _FEATURE_DATA_FLOAT:
+            return (self._get_float, self._set_float_limited, self._range_query_float,
+                    self._increment_query_float)
+        if data_type == _FEATURE_DATA_ENUM:
+            return self._get_enum, self._set_enum, self._range_query_enum, None
+        if data_type == _FEATURE_DATA_STRING:
+            return self._get_string, self._set_string, None, None
+        if data_type == _FEATURE_DATA_BOOL:
+            return self._get_bool, self._set_bool, None, None
+        if data_type == _FEATURE_DATA_RAW:
+            return self._get_raw, self._set_raw, None, None
 
         # doesn't make sense to get / set a command data type
         if data_type == _FEATURE_DATA_COMMAND:
-            raise VimbaException(VimbaException.ERR_COMMAND_MUST_BE_CALLED)
+            return self._command_must_be_called, self._command_must_be_called, None, None
 
         # some data types aren't implemented
-        try:
-            return access_funcs[data_type][access_indices[func_type]]
-        except IndexError:
-            raise VimbaException(VimbaException.ERR_NOT_IMPLEMENTED_IN_PYMBA)
+        return self._not_implemented, self._not_implemented, None, None
+
+    @staticmethod
+    def _command_must_be_called(*args) -> None:
+        raise VimbaException(VimbaException.ERR_COMMAND_MUST_BE_CALLED)
+
+    @staticmethod
+    def _not_implemented(*args) -> None:
+        raise VimbaException(VimbaException.ERR_NOT_IMPLEMENTED_IN_PYMBA)
 
     def _feature_info(self) -> vimba_c.VmbFeatureInfo:
         vmb_feature_info = vimba_c.VmbFeatureInfo()
@@ -118,15 +313,224 @@ class Feature:
 
         return vmb_feature_info
 
-    def _get_int(self) -> int:
+    def _restore_metadata(self, enum_entries: Optional[Dict[str, int]] = None,
+                          affected_feature_names: Optional[List[str]] = None,
+                          selected_feature_names: Optional[List[str]] = None) -> None:
+        """
+        Use previously gathered static metadata instead of querying it on first use.
+        :param enum_entries: the entries of an enum feature and their integer values.
+        :param affected_feature_names: names of the features affected by this feature.
+        :param selected_feature_names: names of the features selected by this feature.
+        """
+        if enum_entries is not None:
+            self._enum_tables = enum_entries, {value: entry
+                                               for entry, value in enum_entries.items()}
+        if affected_feature_names is not None:
+            self._affected_feature_names = affected_feature_names
+        if selected_feature_names is not None:
+            self._selected_feature_names = selected_feature_names
+
+    def _watch_limits(self) -> bool:
+        """
+        Make sure the cached range and increment are forgotten whenever the feature is
+        invalidated. Returns False if they can't be cached.
+        """
+        # volatile features may change their limits without being invalidated
+        if self._info.featureFlags & _FEATURE_FLAGS_VOLATILE:
+            return False
+
+        if not self._limits_watched and self._watch is not None:
+            try:
+                self._watch(self.name, self._invalidate_limits)
+            except VimbaException:
+                return False
+            self._limits_watched = True
+        return self._limits_watched
+
+    def _invalidate_limits(self, name: Optional[str] = None) -> None:
+        # setting a value invalidates the feature but doesn't change its own limits
+        if name is not None and self._limited_set_in_progress:
+            return
+        self._limits_generation += 1
+        self._cached_range = _NOT_CACHED
+        self._cached_increment = _NOT_CACHED
+
+    def _forget_limits(self) -> None:
+        """
+        Forget the cached limits once the feature's handle is closed, as the invalidation listener
+        no longer exists.
+        """
+        self._invalidate_limits()
+        self._limits_watched = False
+
+    def _cached_limit(self, attr: str, query: Callable):
+        """
+        Gets the cached range or increment, querying and caching it if required.
+        :param attr: the attribute caching the limit.
+        :param query: function to query the limit.
+        """
+        value = getattr(self, attr)
+        if value is _NOT_CACHED:
+            if not self._watch_limits():
+                return query()
+
+            # don't cache a limit if the feature was invalidated while it was being queried
+            generation = self._limits_generation
+            value = query()
+            if generation == self._limits_generation:
+                setattr(self, attr, value)
+        return value
+
+    def _query_increment(self) -> Union[int, float, VimbaException]:
+        # float features may have no increment, which is cached as the error
+        try:
+            return self._increment_query()
+        except VimbaException as e:
+            return e
+
+    def _limits(self, requery: bool) -> Tuple[Union[Tuple[int, int], Tuple[float, float]],
+                                               Union[None, int, float]]:
+        """
+        Gets the (range, increment) of an int or float feature, increment being None if the
+        feature has none.
+        :param requery: if True the limits are queried from the camera rather than the cache.
+        """
+        if requery:
+            self._invalidate_limits()
+        increment = self._cached_limit('_cached_increment', self._query_increment)
+        if isinstance(increment, VimbaException):
+            increment = None
+        return self._cached_limit('_cached_range', self._range_query), increment
+
+    def _limit(self, value: Union[int, float]) -> Union[int, float]:
+        """
+        Check or clamp a value about to be set according to the limit mode.
+        :param value: the value to set.
+        """
+        limited = self._limit_value(value, *self._limits(False))
+        if limited != value:
+            # only trust the cached limits if they let the value through unchanged
+            limited = self._limit_value(value, *self._limits(True))
+            if limited is None:
+                raise VimbaException(VimbaException.ERR_VALUE_INVALID)
+        return limited
+
+    def _limit_value(self, value: Union[int, float],
+                     range_: Union[Tuple[int, int], Tuple[float, float]],
+                     increment: Union[None, int, float]) -> Union[None, int, float]:
+        """
+        Gets the value to set given the feature's limits, or None if the value must be rejected.
+        """
+        low, high = range_
+        if self._limit_mode == 'check':
+            if not low <= value <= high:
+                return None
+            # camera firmware rounds floats itself
+            if increment and self._info.featureDataType == _FEATURE_DATA_INT and \
+                    (value - low) % increment:
+                return None
+            return value
+
+        value = min(max(value, low), high)
+        if increment:
+            if self._info.featureDataType == _FEATURE_DATA_INT:
+                steps = (value - low + increment // 2) // increment
+                value = low + min(steps, (high - low) // increment) * increment
+            else:
+                steps = round((value - low) / increment)
+                value = min(low + steps * increment, high)
+        return value
+
+    def is_enum_entry_available(self, entry: str) -> bool:
+        """
+        Check whether an entry of an enum feature can currently be set.
+        :param entry: the name of the enum entry.
+        """
+        self._require_enum()
+        is_available = c_bool()
+        error = vimba_c.vmb_feature_enum_is_available(self._handle,
+                                                      self._name,
+                                                      entry.encode(),
+                                                      byref(is_available))
+        if error:
+            raise VimbaException(error)
+
+        return is_available.value
+
+    def _require_enum(self) -> None:
+        if self._info.featureDataType != _FEATURE_DATA_ENUM:
+            raise VimbaException(VimbaException.ERR_FEATURE_TYPE_WRONG)
+
+    def _enum_table(self) -> Tuple[Dict[str, int], Dict[int, str]]:
+        """
+        Gets the (entry to int, int to entry) tables of an enum feature, querying them on first
+        use.
+        """
+        if self._enum_tables is None:
+            entries = {entry: self._enum_as_int(entry) for entry in self._enum_range_query()}
+            self._enum_tables = entries, {value: entry for entry, value in entries.items()}
+        return self._enum_tables
+
+    def _enum_as_int(self, entry: str) -> int:
         value = c_int64()
+        error = vimba_c.vmb_feature_enum_as_int(self._handle,
+                                                self._name,
+                                                entry.encode(),
+                                                byref(value))
+        if error:
+            raise VimbaException(error)
+
+        return value.value
+
+    def _enum_as_string(self, value: int) -> str:
+        entry = c_char_p()
+        error = vimba_c.vmb_feature_enum_as_string(self._handle,
+                                                   self._name,
+                                                   value,
+                                                   byref(entry))
+        if error:
+            raise VimbaException(error)
+
+        return entry.value.decode()
+
+    def _list_related(self, list_func: Callable) -> List[str]:
+        """
+        Gets the names of related features using a two phase Vimba listing function.
+        :param list_func: either vmb_feature_list_affected or vmb_feature_list_selected.
+        """
+        # call once to get number of related features
+        num_found = c_uint32(-1)
+        error = list_func(self._handle,
+                          self._name,
+                          None,
+                          0,
+                          byref(num_found),
+                          sizeof(vimba_c.VmbFeatureInfo))
+        if error:
+            raise VimbaException(error)
+
+        # call again to get the features
+        num_features = num_found.value
+        vmb_feature_infos = (vimba_c.VmbFeatureInfo * num_features)()
+        error = list_func(self._handle,
+                          self._name,
+                          vmb_feature_infos,
+                          num_features,
+                          byref(num_found),
+                          sizeof(vimba_c.VmbFeatureInfo))
+        if error:
+            raise VimbaException(error)
+
+        return list(vmb_feature_info.name.decode() for vmb_feature_info in vmb_feature_infos)
+
+    def _get_int(self) -> int:
         error = vimba_c.vmb_feature_int_get(self._handle,
                                             self._name,
-                                            byref(value))
+                                            self._value_ref)
         if error:
             raise VimbaException(error)
 
-        return value.value
+        return self._value_c.value
 
     def _set_int(self, value: int) -> None:
         error = vimba_c.vmb_feature_int_set(self._handle,
@@ -135,15 +539,26 @@ class Feature:
         if error:
             raise VimbaException(error)
 
+    def _set_int_limited(self, value: int) -> None:
+        if self._limit_mode is None:
+            self._set_int(value)
+            return
+
+        value = self._limit(value)
+        self._limited_set_in_progress = True
+        try:
+            self._set_int(value)
+        finally:
+            self._limited_set_in_progress = False
+
     def _get_float(self) -> float:
-        value = c_double()
         error = vimba_c.vmb_feature_float_get(self._handle,
                                               self._name,
-                                              byref(value))
+                                              self._value_ref)
         if error:
             raise VimbaException(error)
 
-        return value.value
+        return self._value_c.value
 
     def _set_float(self, value: float) -> None:
         error = vimba_c.vmb_feature_float_set(self._handle,
@@ -152,15 +567,32 @@ class Feature:
         if error:
             raise VimbaException(error)
 
+    def _set_float_limited(self, value: float) -> None:
+        if self._limit_mode is None:
+            self._set_float(value)
+            return
+
+        value = self._limit(value)
+        self._limited_set_in_progress = True
+        try:
+            self._set_float(value)
+        finally:
+            self._limited_set_in_progress = False
+
     def _get_enum(self) -> str:
-        value = c_char_p()
         error = vimba_c.vmb_feature_enum_get(self._handle,
                                              self._name,
-                                             byref(value))
+                                             self._value_ref)
         if error:
             raise VimbaException(error)
 
-        return value.value.decode()
+        # entries are few, so decode each of them once only
+        entry = self._value_c.value
+        try:
+            return self._enum_entries_decoded[entry]
+        except KeyError:
+            self._enum_entries_decoded[entry] = entry.decode()
+            return self._enum_entries_decoded[entry]
 
     def _set_enum(self, value: str):
         error = vimba_c.vmb_feature_enum_set(self._handle,
@@ -170,18 +602,24 @@ class Feature:
             raise VimbaException(error)
 
     def _get_string(self) -> str:
-        buffer_size = 256
-        value = create_string_buffer(buffer_size)
-        size_filled = c_uint32()
-
-        error = vimba_c.vmb_feature_string_get(self._handle,
-                                               self._name,
-                                               value,
-                                               buffer_size,
-                                               byref(size_filled))
+        if self._string_buffer is None:
+            max_length = c_uint32()
+            error = vimba_c.vmb_feature_string_max_length_query(self._handle,
+                                                                self._name,
+                                                                byref(max_length))
+            if error:
+                raise VimbaException(error)
+
+            # allow for the terminating null
+            self._string_buffer = create_string_buffer(max_length.value + 1)
+
+        error, self._string_buffer = _string_get(self._handle,
+                                                 self._name,
+                                                 self._string_buffer,
+                                                 self._value_c)
         if error:
             raise VimbaException(error)
-        return value.value.decode()
+        return self._string_buffer.value.decode()
 
     def _set_string(self, value: str) -> None:
         error = vimba_c.vmb_feature_string_set(self._handle,
@@ -191,14 +629,13 @@ class Feature:
             raise VimbaException(error)
 
     def _get_bool(self) -> bool:
-        value = c_bool()
         error = vimba_c.vmb_feature_bool_get(self._handle,
                                              self._name,
-                                             byref(value))
+                                             self._value_ref)
         if error:
             raise VimbaException(error)
 
-        return value.value
+        return self._value_c.value
 
     def _set_bool(self, value: bool):
         error = vimba_c.vmb_feature_bool_set(self._handle,
@@ -207,6 +644,61 @@ class Feature:
         if error:
             raise VimbaException(error)
 
+    def _raw_length_query(self) -> int:
+        length = c_uint32()
+        error = vimba_c.vmb_feature_raw_length_query(self._handle,
+                                                     self._name,
+                                                     byref(length))
+        if error:
+            raise VimbaException(error)
+
+        return length.value
+
+    def get_raw_into(self, buffer) -> int:
+        """
+        Get the value of a raw feature directly into a writable buffer, e.g. a bytearray or a
+        NumPy array, without any intermediate copy. Returns the number of bytes filled.
+        :param buffer: a writable, C contiguous object supporting the buffer protocol.
+        """
+        size = memoryview(buffer).nbytes
+        c_buffer = (c_char * size).from_buffer(buffer)
+        error = vimba_c.vmb_feature_raw_get(self._handle,
+                                            self._name,
+                                            c_buffer,
+                                            size,
+                                            self._value_ref)
+        if error:
+            raise VimbaException(error)
+
+        return self._value_c.value
+
+    def _get_raw(self) -> bytearray:
+        buffer = bytearray(self._raw_length_query())
+        size_filled = self.get_raw_into(buffer)
+
+        # truncate in place rather than copying
+        del buffer[size_filled:]
+        return buffer
+
+    def _set_raw(self, value) -> None:
+        # bytes can be passed as is, other buffers are wrapped without copying where possible
+        if isinstance(value, bytes):
+            c_buffer = value
+            size = len(value)
+        else:
+            view = memoryview(value)
+            size = view.nbytes
+            # ctypes can only wrap writable, C contiguous buffers
+            c_buffer = view.tobytes() if view.readonly or not view.c_contiguous \
+                else (c_char * size).from_buffer(view)
+
+        error = vimba_c.vmb_feature_raw_set(self._handle,
+                                            self._name,
+                                            c_buffer,
+                                            size)
+        if error:
+            raise VimbaException(error)
+
     def _range_query_int(self) -> Tuple[int, int]:
         range_min = c_int64()
         range_max = c_int64()
@@ -232,6 +724,9 @@ class Feature:
         return range_min.value, range_max.value
 
     def _range_query_enum(self) -> List[str]:
+        return list(self._enum_table()[0])
+
+    def _enum_range_query(self) -> List[str]:
         # call once to get number of available enum names
         num_found = c_uint32(-1)
         error = vimba_c.vmb_feature_enum_range_query(self._handle,
@@ -274,3 +769,77 @@ class Feature:
             raise VimbaException(error)
 
         return float(increment.value)
+
+
+class FeatureAccessor:
+    """
+    A lightweight handle for fast repeated access to the value of a single feature. The feature's
+    name is encoded, its data type resolved and its out parameter allocated once, so that getting
+    or setting an int, float, bool or enum value is a single C call. Remains valid while the
+    feature's data type is unchanged, including across reopening its Vimba object.
+    """
+    __slots__ = ('get', 'set', '_handle', '_name', '_feature', '_get_func', '_set_func',
+                 '_value_c', '_value_ref', '_enum_entries_encoded')
+
+    def __init__(self, feature: Feature):
+        """
+        :param feature: the feature to access.
+        """
+        self._handle = feature._handle
+        self._name = feature._name
+        self._feature = feature
+
+        data_type = feature.info.featureDataType
+        get_set_funcs = {
+            _FEATURE_DATA_INT: (vimba_c.vmb_feature_int_get, vimba_c.vmb_feature_int_set),
+            _FEATURE_DATA_FLOAT: (vimba_c.vmb_feature_float_get, vimba_c.vmb_feature_float_set),
+            _FEATURE_DATA_BOOL: (vimba_c.vmb_feature_bool_get, vimba_c.vmb_feature_bool_set),
+            _FEATURE_DATA_ENUM: (vimba_c.vmb_feature_enum_get, vimba_c.vmb_feature_enum_set),
+        }
+
+        if data_type in get_set_funcs:
+            self._get_func, self._set_func = get_set_funcs[data_type]
+            self._value_c = _DATA_TYPE_TO_CTYPE[data_type]()
+            self._value_ref = byref(self._value_c)
+            if data_type == _FEATURE_DATA_ENUM:
+                self._enum_entries_encoded = {}
+                self.get = feature._get_enum
+                self.set = self._set_enum
+            else:
+                self.get = self._get
+                self.set = self._set
+        else:
+            # other data types aren't accessed in a hot loop, use the feature's own functions
+            self.get = feature._getter
+            self.set = feature._setter
+
+    @property
+    def name(self) -> str:
+        return self._name.decode()
+
+    @property
+    def feature(self) -> Feature:
+        return self._feature
+
+    def _get(self):
+        error = self._get_func(self._handle, self._name, self._value_ref)
+        if error:
+            raise VimbaException(error)
+
+        return self._value_c.value
+
+    def _set(self, value) -> None:
+        error = self._set_func(self._handle, self._name, value)
+        if error:
+            raise VimbaException(error)
+
+    def _set_enum(self, value: str) -> None:
+        # entries are few, so encode each of them once only
+        try:
+            entry = self._enum_entries_encoded[value]
+        except KeyError:
+            entry = self._enum_entries_encoded[value] = value.encode()
+
+        error = self._set_func(self._handle, self._name, entry)
+        if error:
+            raise VimbaException(error)
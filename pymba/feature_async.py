@@ -0,0 +1,150 @@
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List
+
+
+# request kinds
+_GET = 0
+_GET_MANY = 1
+_SET = 2
+
+
+class _Request:
+    """
+    A feature request awaiting its turn on the executor of a Vimba object.
+    """
+    __slots__ = ('kind', 'names', 'value', 'future', 'loop')
+
+    def __init__(self, kind: int, names: List[str], value: Any, future: asyncio.Future,
+                 loop: asyncio.AbstractEventLoop):
+        self.kind = kind
+        self.names = names
+        self.value = value
+        self.future = future
+        self.loop = loop
+
+
+def _set_result(future: asyncio.Future, result) -> None:
+    # the awaiting task may have been cancelled in the meantime
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future, exception: Exception) -> None:
+    if not future.done():
+        future.set_exception(exception)
+
+
+def _post(request: _Request, set_outcome: Callable, outcome) -> None:
+    """
+    Posts the outcome of a request to its event loop, which may have closed in the meantime, e.g.
+    if the awaiting task timed out and asyncio.run returned.
+    """
+    try:
+        request.loop.call_soon_threadsafe(set_outcome, request.future, outcome)
+    except RuntimeError:
+        if not request.loop.is_closed():
+            raise
+
+
+class _AsyncFeatureRequests:
+    """
+    Runs the asyncio feature requests of a Vimba object on a single worker thread, so that they
+    reach the handle in the order they were made. Requests are queued and the queue is drained in
+    one go, reading the values of adjacent get requests in a single batch.
+    """
+
+    def __init__(self, vimba_object):
+        """
+        :param vimba_object: the Vimba object to make the requests of.
+        """
+        self._vimba_object = vimba_object
+        self._executor = ThreadPoolExecutor(max_workers=1,
+                                            thread_name_prefix='pymba feature requests')
+        self._lock = threading.Lock()
+        self._requests = deque()
+        self._draining = False
+
+    async def request(self, kind: int, names: List[str], value: Any = None):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            self._requests.append(_Request(kind, names, value, future, loop))
+            # a single drain at a time keeps requests in order
+            if not self._draining:
+                self._draining = True
+                self._executor.submit(self._drain)
+        return await future
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    def _drain(self) -> None:
+        try:
+            while True:
+                with self._lock:
+                    if not self._requests:
+                        return
+                    requests = list(self._requests)
+                    self._requests.clear()
+
+                # group adjacent gets into batches, keeping sets in between them in order
+                batch = []
+                for request in requests:
+                    if request.kind == _SET:
+                        self._get(batch)
+                        batch = []
+                        self._set(request)
+                    else:
+                        batch.append(request)
+                self._get(batch)
+        finally:
+            # let the next request start a drain, even if this one failed
+            with self._lock:
+                self._draining = False
+                restart = bool(self._requests)
+                if restart:
+                    self._draining = True
+            if restart:
+                self._executor.submit(self._drain)
+
+    def _get(self, requests: List[_Request]) -> None:
+        if not requests:
+            return
+
+        names = list(dict.fromkeys(name for request in requests for name in request.names))
+        try:
+            values = self._vimba_object.get_features(names)
+        except Exception as e:
+            for request in requests:
+                _post(request, _set_exception, e)
+            return
+
+        for request in requests:
+            if request.kind == _GET_MANY:
+                result = {name: values[name] for name in request.names if name in values}
+                _post(request, _set_result, result)
+                continue
+
+            name = request.names[0]
+            try:
+                # read features left out of the batch on their own, raising their error
+                result = values[name] if name in values else \
+                    self._vimba_object.feature(name).value
+            except Exception as e:
+                _post(request, _set_exception, e)
+            else:
+                _post(request, _set_result, result)
+
+    def _set(self, request: _Request) -> None:
+        name = request.names[0]
+        try:
+            self._vimba_object._set_feature_value(name, self._vimba_object.feature(name),
+                                                  request.value)
+        except Exception as e:
+            _post(request, _set_exception, e)
+        else:
+            _post(request, _set_result, None)
+
@@ -0,0 +1,173 @@
+import json
+import os
+import re
+from typing import Optional, Dict, Any
+
+from .vimba_exception import VimbaException
+from .feature import Feature, _FEATURE_DATA_ENUM, _FEATURE_DATA_STRING
+from . import camera as _camera
+from . import vimba as _vimba
+from . import vimba_c
+
+
+# bump when the file format changes so that old files are ignored
+_CACHE_FORMAT_VERSION = 1
+
+# VmbFeatureInfo fields holding strings, all other fields hold numbers or bools
+_STRING_FIELDS = ('name', 'category', 'displayName', 'unit', 'representation', 'tooltip',
+                  'description', 'sfncNamespace')
+
+
+def _default_directory() -> str:
+    if 'PYMBA_CACHE_DIR' in os.environ:
+        return os.environ['PYMBA_CACHE_DIR']
+    return os.path.join(os.path.expanduser('~'), '.cache', 'pymba')
+
+
+def _info_to_dict(vmb_feature_info: vimba_c.VmbFeatureInfo) -> Dict[str, Any]:
+    info = {}
+    for field, _ in vimba_c.VmbFeatureInfo._fields_:
+        value = getattr(vmb_feature_info, field)
+        if field in _STRING_FIELDS and value is not None:
+            value = value.decode()
+        info[field] = value
+    return info
+
+
+def _info_from_dict(info: Dict[str, Any]) -> vimba_c.VmbFeatureInfo:
+    vmb_feature_info = vimba_c.VmbFeatureInfo()
+    for field, _ in vimba_c.VmbFeatureInfo._fields_:
+        value = info[field]
+        # the structure keeps a reference to assigned bytes
+        if field in _STRING_FIELDS and value is not None:
+            value = value.encode()
+        setattr(vmb_feature_info, field, value)
+    return vmb_feature_info
+
+
+class FeatureCache:
+    """
+    An on disk cache of camera feature tables, i.e. the info, enum entries and relations of every
+    feature, keyed by camera model and firmware version. Pass to Camera.open to skip listing and
+    querying features on cameras whose feature table has been seen before, including by other
+    processes.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        :param directory: directory to keep the cache files in. Defaults to the PYMBA_CACHE_DIR
+        environment variable if set, otherwise ~/.cache/pymba.
+        """
+        self._directory = _default_directory() if directory is None else directory
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @staticmethod
+    def _key(camera: '_camera.Camera') -> Optional[str]:
+        """
+        Gets the cache key of an opened camera, or None if the camera doesn't report its firmware
+        version.
+        """
+        try:
+            firmware_version = Feature('DeviceFirmwareVersion', camera.handle)
+            if firmware_version.info.featureDataType != _FEATURE_DATA_STRING:
+                return None
+            firmware_version = firmware_version.value
+        except VimbaException:
+            return None
+
+        # the Vimba version is included as its transport layers may add features
+        return '_'.join((camera.info.modelName.decode(), firmware_version,
+                         _vimba.Vimba.version()))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, re.sub(r'[^\w.-]', '_', key) + '.json')
+
+    def restore(self, camera: '_camera.Camera') -> bool:
+        """
+        Restore the feature table of an opened camera from the cache. Returns False if the camera
+        is not cached, or the cached table can't be read or doesn't match the camera.
+        :param camera: the opened camera.
+        """
+        key = self._key(camera)
+        if key is None:
+            return False
+
+        try:
+            with open(self._path(key)) as file:
+                table = json.load(file)
+        except (OSError, ValueError):
+            return False
+
+        # a damaged or hand edited file is treated as a cache miss
+        try:
+            if table.get('version') != _CACHE_FORMAT_VERSION or table.get('key') != key:
+                return False
+
+            # cheap sanity check that the camera still has the same features
+            if len(table['features']) != camera._num_features():
+                return False
+
+            feature_infos = {}
+            features = {}
+            for entry in table['features']:
+                vmb_feature_info = _info_from_dict(entry['info'])
+                name = entry['info']['name']
+                feature = Feature(name, camera.handle, vmb_feature_info,
+                                  camera._add_feature_invalidation_listener)
+                feature._restore_metadata(entry.get('enum_entries'),
+                                          entry.get('affected_feature_names'),
+                                          entry.get('selected_feature_names'))
+                feature_infos[name] = vmb_feature_info
+                features[name] = feature
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return False
+
+        camera._restore_feature_cache(feature_infos, features)
+        return True
+
+    def store(self, camera: '_camera.Camera') -> None:
+        """
+        Gather the feature table of an opened camera and write it to the cache. Metadata that
+        can't be gathered is left out and queried on first use instead. The table isn't stored if
+        the cache can't be written, e.g. if the disk is full.
+        :param camera: the opened camera.
+        """
+        key = self._key(camera)
+        if key is None:
+            return
+
+        entries = []
+        for name in camera.feature_names():
+            feature = camera.feature(name)
+            entry = {'info': _info_to_dict(feature.info)}
+            try:
+                entry['affected_feature_names'] = feature.affected_feature_names
+                entry['selected_feature_names'] = feature.selected_feature_names
+                if feature.info.featureDataType == _FEATURE_DATA_ENUM:
+                    entry['enum_entries'] = feature.enum_entries
+            except VimbaException:
+                pass
+            entries.append(entry)
+
+        table = {
+            'version': _CACHE_FORMAT_VERSION,
+            'key': key,
+            'features': entries,
+        }
+
+        # write to a temporary file first so that other processes never read a partial file
+        path = self._path(key)
+        temp_path = '{}.{}.tmp'.format(path, os.getpid())
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            with open(temp_path, 'w') as file:
+                json.dump(table, file)
+            os.replace(temp_path, path)
+        except (OSError, TypeError, ValueError):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
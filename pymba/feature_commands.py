@@ -0,0 +1,145 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from ctypes import byref, c_bool
+from typing import Optional, List, Iterable
+
+from .vimba_exception import VimbaException
+from . import vimba_c
+
+
+# completion polling starts fast, as most commands finish quickly, and backs off to this
+_INITIAL_POLL_DELAY = 0.0005
+_MAX_POLL_DELAY = 0.05
+
+
+class _PendingCommand:
+    """
+    A command that has been run and whose completion is being polled for.
+    """
+
+    def __init__(self, handle, feature_name: str, future: Future, deadline: Optional[float]):
+        self.handle = handle
+        self.feature_name = feature_name.encode()
+        self.future = future
+        self.deadline = deadline
+        self.delay = _INITIAL_POLL_DELAY
+        self.is_done = c_bool()
+
+
+class _CommandPoller:
+    """
+    Polls the completion of the commands of all Vimba objects on a single background thread,
+    which only runs while there are commands pending.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+
+        # heap of (due time, sequence number, pending command)
+        self._schedule = []
+        self._sequence = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, pending: _PendingCommand) -> None:
+        with self._condition:
+            self._push(pending, time.monotonic() + pending.delay)
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='pymba command poller',
+                                                daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _push(self, pending: _PendingCommand, due: float) -> None:
+        heapq.heappush(self._schedule, (due, next(self._sequence), pending))
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    if not self._schedule:
+                        self._thread = None
+                        return
+                    wait = self._schedule[0][0] - time.monotonic()
+                    if wait <= 0:
+                        break
+                    self._condition.wait(wait)
+                pending = heapq.heappop(self._schedule)[2]
+
+            if self._poll(pending):
+                with self._condition:
+                    # back off exponentially, but never past the deadline
+                    pending.delay = min(pending.delay * 2, _MAX_POLL_DELAY)
+                    due = time.monotonic() + pending.delay
+                    if pending.deadline is not None:
+                        due = min(due, pending.deadline)
+                    self._push(pending, due)
+
+    @staticmethod
+    def _poll(pending: _PendingCommand) -> bool:
+        """
+        Check whether a command is done, completing its future if so. Returns True if the command
+        needs polling again.
+        """
+        error = vimba_c.vmb_feature_command_is_done(pending.handle,
+                                                    pending.feature_name,
+                                                    byref(pending.is_done))
+        if error:
+            pending.future.set_exception(VimbaException(error))
+            return False
+
+        if pending.is_done.value:
+            pending.future.set_result(None)
+            return False
+
+        if pending.deadline is not None and time.monotonic() >= pending.deadline:
+            pending.future.set_exception(VimbaException(VimbaException.ERR_TIMEOUT))
+            return False
+
+        return True
+
+
+_poller = _CommandPoller()
+
+
+def run_feature_command_async(vimba_object, feature_name: str,
+                              timeout: Optional[float] = None) -> Future:
+    """
+    Run a feature command and get a future that completes once the command is done. See
+    VimbaObject.run_feature_command_async.
+    """
+    vimba_object.run_feature_command(feature_name)
+
+    # the command is already running on the device, so the future can't be cancelled
+    future = Future()
+    future.set_running_or_notify_cancel()
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    _poller.add(_PendingCommand(vimba_object._handle, feature_name, future, deadline))
+    return future
+
+
+def run_feature_commands_async(vimba_objects: Iterable, feature_name: str,
+                               timeout: Optional[float] = None) -> List[Future]:
+    """
+    Run the same feature command on many Vimba objects, e.g. GVSPAdjustPacketSize on every camera,
+    and get a future for each. All commands are started before any completes, and completion of
+    all of them is polled on a single shared thread.
+    :param vimba_objects: the Vimba objects to run the command on.
+    :param feature_name: the name of the command feature.
+    :param timeout: time in seconds after which a command that isn't done fails with a timeout
+    error.
+    """
+    futures = []
+    for vimba_object in vimba_objects:
+        try:
+            futures.append(run_feature_command_async(vimba_object, feature_name, timeout))
+        except VimbaException as e:
+            # failing to start on one object mustn't stop the command running on the others
+            future = Future()
+            future.set_exception(e)
+            futures.append(future)
+    return futures
@@ -0,0 +1,169 @@
+import heapq
+import itertools
+import threading
+import time
+import traceback
+from typing import Callable, Optional, List, Any
+
+from .vimba_exception import VimbaException
+from .feature import FeatureAccessor
+
+
+# watches falling due within this many seconds of each other are polled in the same pass
+_COALESCE_WINDOW = 0.005
+
+# marks a watch that hasn't read a value yet
+_NO_VALUE = object()
+
+
+class FeatureWatch:
+    """
+    A subscription to the value of a feature, polled in the background at a fixed interval. The
+    callback is called, or the queue is put to, with (vimba object, feature name, value) whenever
+    the value changes. Create with VimbaObject.watch_feature.
+    """
+
+    def __init__(self, vimba_object, feature_name: str, accessor: FeatureAccessor, interval: float,
+                 callback: Optional[Callable[[Any, str, Any], None]] = None, queue=None):
+        """
+        :param vimba_object: the Vimba object the feature belongs to.
+        :param feature_name: the name of the feature.
+        :param accessor: accessor used to read the feature, owned by the watch.
+        :param interval: the time between reads in seconds.
+        :param callback: function called on the poller thread with each new value.
+        :param queue: queue, e.g. a queue.Queue, to put each new value to.
+        """
+        self._vimba_object = vimba_object
+        self._feature_name = feature_name
+        self._accessor = accessor
+        self._interval = interval
+        self._callback = callback
+        self._queue = queue
+
+        self._last_value = _NO_VALUE
+        self._due = 0.0
+        self._cancelled = False
+
+    @property
+    def feature_name(self) -> str:
+        return self._feature_name
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    def cancel(self) -> None:
+        """
+        Stop watching the feature.
+        """
+        self._vimba_object.unwatch_feature(self)
+
+    def _deliver(self, value) -> None:
+        if self._callback is not None:
+            try:
+                self._callback(self._vimba_object, self._feature_name, value)
+            except Exception:
+                # a failing callback mustn't stop the poller for every other watch
+                traceback.print_exc()
+        if self._queue is not None:
+            self._queue.put((self._vimba_object, self._feature_name, value))
+
+
+class _FeaturePoller:
+    """
+    Polls the watched features of all Vimba objects on a single background thread, which only
+    runs while there is something to watch.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+
+        # heap of (due time, sequence number, watch), cancelled watches are dropped as they fall due
+        self._schedule = []
+        self._sequence = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, watch: FeatureWatch) -> None:
+        with self._condition:
+            watch._due = time.monotonic()
+            heapq.heappush(self._schedule, (watch._due, next(self._sequence), watch))
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='pymba feature poller',
+                                                daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def remove(self, watch: FeatureWatch) -> None:
+        with self._condition:
+            watch._cancelled = True
+
+    def _next_due(self) -> Optional[List[FeatureWatch]]:
+        """
+        Wait for watches to fall due and take them off the schedule, or return None once nothing
+        is left to watch. Must be called with the condition held.
+        """
+        while True:
+            while self._schedule and self._schedule[0][2]._cancelled:
+                heapq.heappop(self._schedule)
+            if not self._schedule:
+                return None
+
+            wait = self._schedule[0][0] - time.monotonic()
+            if wait <= 0:
+                break
+            self._condition.wait(wait)
+
+        horizon = time.monotonic() + _COALESCE_WINDOW
+        watches = []
+        while self._schedule and self._schedule[0][0] <= horizon:
+            watch = heapq.heappop(self._schedule)[2]
+            if not watch._cancelled:
+                watches.append(watch)
+        return watches
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                watches = self._next_due()
+                if watches is None:
+                    self._thread = None
+                    return
+
+            self._poll(watches)
+
+            with self._condition:
+                now = time.monotonic()
+                for watch in watches:
+                    if watch._cancelled:
+                        continue
+                    watch._due += watch._interval
+                    # skip missed reads rather than catching up in a burst
+                    if watch._due < now:
+                        watch._due = now + watch._interval
+                    heapq.heappush(self._schedule, (watch._due, next(self._sequence), watch))
+
+    @staticmethod
+    def _poll(watches: List[FeatureWatch]) -> None:
+        """
+        Read the watched features, reading each feature once however many watches it has, and
+        deliver the values that changed.
+        """
+        values = {}
+        for watch in watches:
+            key = id(watch._vimba_object), watch._feature_name
+            if key not in values:
+                try:
+                    values[key] = watch._accessor.get()
+                except VimbaException:
+                    # e.g. the feature is temporarily unavailable, try again next time
+                    values[key] = _NO_VALUE
+
+            value = values[key]
+            if value is _NO_VALUE or value == watch._last_value:
+                continue
+            watch._last_value = value
+            watch._deliver(value)
+
+
+_poller = _FeaturePoller()
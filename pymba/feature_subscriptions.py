@@ -0,0 +1,185 @@
+import heapq
+import itertools
+import threading
+import time
+import traceback
+from typing import Callable, Dict, List, Optional, Any
+
+
+class FeatureSubscription:
+    """
+    A subscription to the invalidation events of one or more features. The callback is called as
+    callback(vimba object, feature name) on the shared dispatcher thread, so slow subscribers never
+    block the Vimba callback thread or each other's events from being queued. Create with
+    VimbaObject.subscribe_feature_invalidations.
+    """
+
+    def __init__(self, hub: '_FeatureInvalidationHub', feature_names: List[str],
+                 callback: Callable[[Any, str], None], debounce: float):
+        """
+        :param hub: the hub of the Vimba object the features belong to.
+        :param feature_names: the names of the subscribed features.
+        :param callback: the function to call with each event.
+        :param debounce: the time in seconds to collect repeated events of a feature for before
+        delivering them as one.
+        """
+        self._hub = hub
+        self._feature_names = feature_names
+        self._callback = callback
+        self._debounce = debounce
+        self._cancelled = False
+
+    @property
+    def feature_names(self) -> List[str]:
+        return list(self._feature_names)
+
+    @property
+    def debounce(self) -> float:
+        return self._debounce
+
+    def cancel(self) -> None:
+        """
+        Stop delivering events, including any that are already queued.
+        """
+        self._hub.unsubscribe(self)
+
+    def _deliver(self, feature_name: str) -> None:
+        if self._cancelled:
+            return
+        try:
+            self._callback(self._hub.vimba_object, feature_name)
+        except Exception:
+            # a failing callback mustn't stop the dispatcher for every other subscription
+            traceback.print_exc()
+
+
+class _FeatureInvalidationDispatcher:
+    """
+    Delivers the invalidation events of all Vimba objects to their subscriptions on a single
+    background thread, started on the first event. Repeated events of a feature falling within a
+    subscription's debounce time are delivered once, at the end of the debounce time.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+
+        # heap of (due time, sequence number, subscription, feature name)
+        self._schedule = []
+        self._sequence = itertools.count()
+
+        # (subscription, feature name) of every event in the schedule
+        self._scheduled = set()
+
+        self._thread: Optional[threading.Thread] = None
+
+    def post(self, feature_name: str, subscriptions: List[FeatureSubscription]) -> None:
+        """
+        Queue an event for delivery to subscriptions. Called on the Vimba callback thread.
+        :param feature_name: the name of the invalidated feature.
+        :param subscriptions: the subscriptions to the feature.
+        """
+        now = time.monotonic()
+        with self._condition:
+            for subscription in subscriptions:
+                key = subscription, feature_name
+                if key in self._scheduled:
+                    continue
+                self._scheduled.add(key)
+                heapq.heappush(self._schedule, (now + subscription._debounce,
+                                                next(self._sequence), subscription, feature_name))
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                                                name='pymba feature invalidation dispatcher',
+                                                daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    if not self._schedule:
+                        self._condition.wait()
+                        continue
+                    wait = self._schedule[0][0] - time.monotonic()
+                    if wait <= 0:
+                        break
+                    self._condition.wait(wait)
+
+                _, _, subscription, feature_name = heapq.heappop(self._schedule)
+                self._scheduled.discard((subscription, feature_name))
+
+            subscription._deliver(feature_name)
+
+
+_dispatcher = _FeatureInvalidationDispatcher()
+
+
+class _FeatureInvalidationHub:
+    """
+    Multiplexes the invalidation events of a Vimba object's features to any number of
+    subscriptions, listening to each feature once however many subscriptions it has.
+    """
+
+    def __init__(self, vimba_object):
+        """
+        :param vimba_object: the Vimba object whose features to listen to.
+        """
+        self.vimba_object = vimba_object
+        self._lock = threading.Lock()
+
+        # feature name -> subscriptions, replaced rather than modified so that events can be
+        # posted without taking the lock
+        self._subscriptions: Dict[str, List[FeatureSubscription]] = {}
+
+    def subscribe(self, feature_names: List[str], callback: Callable[[Any, str], None],
+                  debounce: float) -> FeatureSubscription:
+        subscription = FeatureSubscription(self, feature_names, callback, debounce)
+        with self._lock:
+            subscribed = []
+            try:
+                for feature_name in feature_names:
+                    if feature_name not in self._subscriptions:
+                        self.vimba_object._add_feature_invalidation_listener(
+                            feature_name, self._on_invalidation)
+                        self._subscriptions[feature_name] = []
+                    self._subscriptions[feature_name] = \
+                        self._subscriptions[feature_name] + [subscription]
+                    subscribed.append(feature_name)
+            except Exception:
+                self._remove(subscription, subscribed)
+                raise
+        return subscription
+
+    def unsubscribe(self, subscription: FeatureSubscription) -> None:
+        with self._lock:
+            if not subscription._cancelled:
+                subscription._cancelled = True
+                self._remove(subscription, subscription._feature_names)
+
+    def unsubscribe_all(self) -> None:
+        with self._lock:
+            for feature_name, subscriptions in list(self._subscriptions.items()):
+                for subscription in subscriptions:
+                    subscription._cancelled = True
+                self._remove_listener(feature_name)
+
+    def _remove(self, subscription: FeatureSubscription, feature_names: List[str]) -> None:
+        for feature_name in feature_names:
+            subscriptions = list(s for s in self._subscriptions[feature_name]
+                                 if s is not subscription)
+            if subscriptions:
+                self._subscriptions[feature_name] = subscriptions
+            else:
+                self._remove_listener(feature_name)
+
+    def _remove_listener(self, feature_name: str) -> None:
+        del self._subscriptions[feature_name]
+        self.vimba_object._remove_feature_invalidation_listener(feature_name,
+                                                                self._on_invalidation)
+
+    def _on_invalidation(self, feature_name: str) -> None:
+        subscriptions = self._subscriptions.get(feature_name)
+        if subscriptions:
+            _dispatcher.post(feature_name, subscriptions)
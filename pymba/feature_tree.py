@@ -0,0 +1,151 @@
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, List, Optional, Iterator
+
+from .vimba_exception import VimbaException
+from . import vimba_c
+
+
+# VmbFeatureVisibilityType
+FEATURE_VISIBILITY_UNKNOWN = 0
+FEATURE_VISIBILITY_BEGINNER = 1
+FEATURE_VISIBILITY_EXPERT = 2
+FEATURE_VISIBILITY_GURU = 3
+FEATURE_VISIBILITY_INVISIBLE = 4
+
+
+def _parent_category(category: str) -> Optional[str]:
+    if category in ('', '/'):
+        return None
+    parent = category.rpartition('/')[0]
+    return parent if parent else '/'
+
+
+def _normalized_category(category: str) -> str:
+    # '/ImageFormat/' names the same category as '/ImageFormat', features without one are kept
+    # under ''
+    return category.rstrip('/') or category[:1]
+
+
+def _prefix_range(sorted_strings: List[str], prefix: str) -> slice:
+    """
+    Gets the slice of a sorted list of strings that start with a prefix.
+    """
+    start = bisect_left(sorted_strings, prefix)
+    # every string starting with the prefix sorts before the prefix followed by the largest char
+    stop = bisect_left(sorted_strings, prefix + chr(0x10ffff), start)
+    return slice(start, stop)
+
+
+class FeatureTree:
+    """
+    An index of the features of a Vimba object by name, category and visibility. Categories are
+    paths such as '/ImageFormat/ROI'. The tree is built once from the feature infos of an opened
+    handle, after which lookups by name or category are O(1) and prefix queries are O(log n) plus
+    the size of the result.
+    """
+
+    def __init__(self, feature_infos: Dict[str, vimba_c.VmbFeatureInfo]):
+        """
+        :param feature_infos: feature info of all available features, keyed by feature name.
+        """
+        self._infos = feature_infos
+        self._names = sorted(feature_infos)
+
+        # category -> names of the features directly in it, in listing order
+        self._features_by_category: Dict[str, List[str]] = defaultdict(list)
+        for name, vmb_feature_info in feature_infos.items():
+            category = (vmb_feature_info.category or b'').decode()
+            self._features_by_category[category].append(name)
+        self._features_by_category = dict(self._features_by_category)
+
+        # category -> direct subcategories, including categories that only hold subcategories
+        self._subcategories: Dict[str, List[str]] = defaultdict(list)
+        for category in list(self._features_by_category):
+            parent = _parent_category(category)
+            while parent is not None:
+                if category not in self._subcategories[parent]:
+                    self._subcategories[parent].append(category)
+                category, parent = parent, _parent_category(parent)
+        self._subcategories = {category: sorted(subcategories)
+                               for category, subcategories in self._subcategories.items()}
+
+        self._categories = sorted(set(self._features_by_category) | set(self._subcategories))
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __contains__(self, feature_name: str) -> bool:
+        return feature_name in self._infos
+
+    def info(self, feature_name: str) -> vimba_c.VmbFeatureInfo:
+        """
+        Gets the feature info of a feature.
+        :param feature_name: the name of the feature.
+        """
+        try:
+            return self._infos[feature_name]
+        except KeyError:
+            raise VimbaException(VimbaException.ERR_INSTANCE_NOT_FOUND)
+
+    def _visible(self, feature_names: List[str], max_visibility: Optional[int]) -> List[str]:
+        if max_visibility is None:
+            return list(feature_names)
+        return list(name for name in feature_names
+                    if self._infos[name].visibility <= max_visibility)
+
+    def names(self, max_visibility: Optional[int] = None) -> List[str]:
+        """
+        Gets the names of all features in sorted order.
+        :param max_visibility: if given, only include features whose visibility is at most this,
+        e.g. FEATURE_VISIBILITY_EXPERT.
+        """
+        return self._visible(self._names, max_visibility)
+
+    def names_with_prefix(self, prefix: str, max_visibility: Optional[int] = None) -> List[str]:
+        """
+        Gets the names of the features starting with a prefix, e.g. 'Acquisition', in sorted
+        order.
+        :param prefix: the start of the feature names.
+        :param max_visibility: if given, only include features whose visibility is at most this.
+        """
+        return self._visible(self._names[_prefix_range(self._names, prefix)], max_visibility)
+
+    def categories(self, prefix: str = '') -> List[str]:
+        """
+        Gets all category paths, or only those starting with a prefix, in sorted order.
+        :param prefix: the start of the category paths, e.g. '/ImageFormat'.
+        """
+        return self._categories[_prefix_range(self._categories, prefix)]
+
+    def subcategories(self, category: str) -> List[str]:
+        """
+        Gets the direct subcategories of a category.
+        :param category: the category path, e.g. '/ImageFormat'.
+        """
+        return list(self._subcategories.get(_normalized_category(category), []))
+
+    def category_names(self, category: str, recursive: bool = False,
+                       max_visibility: Optional[int] = None) -> List[str]:
+        """
+        Gets the names of the features in a category.
+        :param category: the category path, e.g. '/ImageFormat'.
+        :param recursive: if True, also include the features of all subcategories.
+        :param max_visibility: if given, only include features whose visibility is at most this.
+        """
+        category = _normalized_category(category)
+        if not recursive:
+            return self._visible(self._features_by_category.get(category, []), max_visibility)
+
+        # the category itself followed by every category below it
+        categories = [category]
+        categories.extend(category_ for category_ in self.categories(category.rstrip('/') + '/')
+                          if category_ != category)
+        names = []
+        for category_ in categories:
+            names.extend(self._visible(self._features_by_category.get(category_, []),
+                                       max_visibility))
+        return names
@@ -1,19 +1,22 @@
-from ctypes import byref, sizeof, addressof, create_string_buffer, cast, POINTER, c_ubyte, c_void_p
-from typing import Optional, Callable
+from ctypes import byref, sizeof, addressof, cast, POINTER, c_ubyte, c_void_p
+from typing import Optional, Callable, Tuple, NamedTuple
+import weakref
 import numpy as np
 
 from . import camera as _camera
 from .vimba_exception import VimbaException
-from .vimba_pixelformat import VmbPixel
+from .vimba_pixelformat import VmbPixel, VmbPixelFormat
+from .frame_allocator import FrameAllocator, DefaultFrameAllocator
+from .pixel_unpack import PACKED_PIXELFORMAT_UNPACKERS
 from . import vimba_c
 
 
 # Translates Vimba pixel formats to the corresponding dtype and number of channels for a numpy
 # array.
-# This covers most formats; except the "packed" and the exotic Yuv/YCbCr formats.
+# This covers most formats; except the exotic Yuv/YCbCr formats. Packed mono and Bayer formats are
+# unpacked by PACKED_PIXELFORMAT_UNPACKERS instead.
 PIXELFORMAT_TO_DTYPE_CHANNELS = {
     VmbPixel.Mono | VmbPixel.Occupy8Bit: (np.uint8, 1),
-    # VmbPixel.Mono | VmbPixel.Occupy12Bit: TODO,
     VmbPixel.Mono | VmbPixel.Occupy16Bit: (np.uint16, 1),
     # VmbPixel.Color | VmbPixel.Occupy12Bit: TODO,
     # VmbPixel.Color | VmbPixel.Occupy16Bit: TODO,
@@ -24,38 +27,146 @@ PIXELFORMAT_TO_DTYPE_CHANNELS = {
 }
 
 
+_default_allocator = DefaultFrameAllocator()
+
+
+class StreamDescriptor(NamedTuple):
+    """
+    The geometry of the frames a camera streams, resolved once when the camera is armed and
+    shared by all of its frames. Fields other than payload_size are None if the camera doesn't
+    report them.
+    """
+    # size of each frame buffer in bytes
+    payload_size: int
+    # pixel format name, e.g. 'Mono8'
+    pixel_format: Optional[str]
+    width: Optional[int]
+    height: Optional[int]
+    # bytes per image line
+    stride: Optional[int]
+
+
+def _stride(pixel_format: Optional[str], width: Optional[int]) -> Optional[int]:
+    """
+    Gets the number of bytes per image line of a pixel format, or None if unknown.
+    """
+    if width is None or pixel_format not in VmbPixelFormat.__members__:
+        return None
+
+    # bits per pixel are encoded in the pixel format value, packed formats may span bytes
+    bits_per_pixel = (VmbPixelFormat[pixel_format] >> 16) & 0xFF
+    return -(-width * bits_per_pixel // 8)
+
+
+def _copy_to(image: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+    """
+    Copy an image into a new array, or in place into a preallocated array of the same shape and
+    dtype.
+    """
+    if out is None:
+        return image.copy()
+
+    if out.shape != image.shape or out.dtype != image.dtype:
+        raise ValueError('Output array must have shape {} and dtype {}, not shape {} and dtype '
+                         '{}.'.format(image.shape, image.dtype, out.shape, out.dtype))
+    np.copyto(out, image)
+    return out
+
+
+class FrameView(np.ndarray):
+    """
+    A NumPy array viewing the image data of a frame without copying it. A view is only valid until
+    its frame is queued for capture again, after which the frame's buffer is overwritten by the
+    next image. Views, and slices and reshapes of them, are made read only when their frame is
+    requeued, and valid can be checked before use. Arrays computed from a view, e.g. by ufuncs,
+    are ordinary arrays.
+    """
+
+    def __array_finalize__(self, obj) -> None:
+        # slices and reshapes of a view share its frame's buffer, so they are made read only along
+        # with it
+        self._frame = getattr(obj, '_frame', None)
+        self._generation = getattr(obj, '_generation', None)
+        if self.valid:
+            self._frame._views.append(weakref.ref(self))
+
+    def __array_wrap__(self, array, context=None, return_scalar=False):
+        array = array.view(np.ndarray)
+        return array[()] if return_scalar else array
+
+    @property
+    def valid(self) -> bool:
+        """
+        Whether the frame still holds the image the view was taken of.
+        """
+        return self._frame is not None and self._frame._generation == self._generation
+
+
 class Frame:
     """
     A Vimba frame.
     """
+    __slots__ = ('_camera', '_stream', 'pixel_format', '_vmb_frame', '_address', '_c_memory',
+                 '_memory', '_payload_size', '_frame_callback', '_generation', '_views')
 
-    def __init__(self, camera: '_camera.Camera'):
+    def __init__(self, camera: '_camera.Camera', stream: Optional[StreamDescriptor] = None):
+        """
+        :param camera: the camera the frame belongs to.
+        :param stream: the geometry of the camera's frames if already resolved, otherwise the
+        camera's features are read when needed.
+        """
         self._camera = camera
-        self.pixel_format = self._camera.PixelFormat
+        self._stream = stream
+        self.pixel_format = self._camera.PixelFormat if stream is None else stream.pixel_format
 
         self._vmb_frame = vimba_c.VmbFrame()
 
+        # identifies the frame in the camera's frame callback
+        self._address = addressof(self._vmb_frame)
+
         self._c_memory = None
+        self._memory = None
+        self._payload_size = None
         self._frame_callback = None
-        self._frame_callback_wrapper_c = None
+
+        # incremented whenever the frame is queued, invalidating views of the previous image
+        self._generation = 0
+        self._views = []
 
     @property
     def data(self) -> vimba_c.VmbFrame:
         return self._vmb_frame
 
-    def announce(self, payload_size: Optional[int] = None) -> None:
+    @property
+    def stream(self) -> Optional[StreamDescriptor]:
+        return self._stream
+
+    def announce(self, payload_size: Optional[int] = None,
+                 allocator: Optional[FrameAllocator] = None) -> None:
         """
         Announce frames to the API that may be queued for frame capturing later. Should be called
         after the frame is created. Call startCapture after this method.
+        :param payload_size: size of the frame buffer to allocate, defaults to the camera's
+        payload size.
+        :param allocator: allocator of the frame buffer, defaults to a DefaultFrameAllocator.
         """
+        camera_payload_size = self._camera.PayloadSize if self._stream is None \
+            else self._stream.payload_size
         if payload_size is None:
-            payload_size = self._camera.PayloadSize
+            payload_size = camera_payload_size
         else:
-            if payload_size < self._camera.PayloadSize:
+            if payload_size < camera_payload_size:
                 raise ValueError("Specified frame buffer is not large enough!")
 
-        # allocate memory for the frame and keep a reference to keep alive
-        self._c_memory = create_string_buffer(payload_size)
+        if allocator is None:
+            allocator = _default_allocator
+
+        # allocate memory for the frame and keep a reference to keep alive, the ctypes array
+        # references the allocated object in turn
+        memory = allocator.allocate(payload_size)
+        self._c_memory = (c_ubyte * memoryview(memory).nbytes).from_buffer(memory)
+        self._memory = memory
+        self._payload_size = payload_size
         address = c_void_p(addressof(self._c_memory))
         if address is None:
             # this seems to be None if too much memory is requested
@@ -63,7 +174,7 @@ class Frame:
 
         # tell the frame about the memory
         self.data.buffer = address
-        self.data.bufferSize = self._camera.PayloadSize
+        self.data.bufferSize = camera_payload_size
 
         error = vimba_c.vmb_frame_announce(self._camera.handle,
                                            byref(self.data),
@@ -80,29 +191,34 @@ class Frame:
         if error:
             raise VimbaException(error)
 
+        self._camera._frames_by_address.pop(self._address, None)
+
+    def _invalidate_views(self) -> None:
+        # the buffer is about to be overwritten, so views of it may no longer be written to
+        self._generation += 1
+        for view_ref in self._views:
+            view = view_ref()
+            if view is not None:
+                view.flags.writeable = False
+        self._views.clear()
+
     def queue_for_capture(self, frame_callback: Optional[Callable] = None) -> None:
         """
         Queue frames that may be filled during frame capturing. Call after announceFrame and
         startCapture. Callback must accept argument of type frame. Remember to requeue the frame by
         calling frame.queue_capture() at the end of your callback function.
         """
-        self._frame_callback = frame_callback
+        self._invalidate_views()
 
-        # define a callback wrapper here so it doesn't bind self
-        def frame_callback_wrapper(camera_handle, frame_ptr):
-            # call the user's callback with the self bound outside the wrapper
-            # ignore the frame pointer since we already know the callback refers to this frame
-            self._frame_callback(self)
+        self._frame_callback = frame_callback
 
-        if self._frame_callback is None:
-            self._frame_callback_wrapper_c = None
-        else:
-            # keep a reference to prevent gc issues
-            self._frame_callback_wrapper_c = vimba_c.vmb_frame_callback_func(frame_callback_wrapper)
+        # the camera's single C callback dispatches to the frame's callback
+        frame_callback_c = None if frame_callback is None else \
+            self._camera._frame_callback_c(self)
 
         error = vimba_c.vmb_capture_frame_queue(self._camera.handle,
                                                 byref(self.data),
-                                                self._frame_callback_wrapper_c)
+                                                frame_callback_c)
         if error:
             raise VimbaException(error)
 
@@ -117,19 +233,56 @@ class Frame:
         if error:
             raise VimbaException(error)
 
+    def view(self) -> FrameView:
+        """
+        Get the frame's image data, excluding any ancillary data, as a flat uint8 NumPy array
+        viewing the frame's buffer without copying it. The view is only valid until the frame is
+        queued for capture again, see FrameView. Use copy to keep the data for longer.
+        """
+        array = np.frombuffer(self._c_memory, dtype=np.uint8, count=self.data.imageSize)
+        view = array.view(FrameView)
+        view._frame = self
+        view._generation = self._generation
+        self._views.append(weakref.ref(view))
+        return view
+
+    def copy(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Get a copy of the frame's image data, excluding any ancillary data, as a flat uint8 NumPy
+        array that remains valid after the frame is requeued.
+        :param out: preallocated array to copy the data into instead of allocating a new one. Must
+        have the shape and dtype of the data.
+        """
+        image = np.frombuffer(self._c_memory, dtype=np.uint8, count=self.data.imageSize)
+        return _copy_to(image, out)
+
+    def to_numpy(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Get a copy of the frame's image as a NumPy array shaped by its pixel format, e.g. (height,
+        width) for mono formats, that remains valid after the frame is requeued. Packed formats
+        are unpacked to uint16.
+        :param out: preallocated array to write the image into instead of allocating a new one,
+        e.g. one of a ring of arrays. Must have the shape and dtype of the image.
+        """
+        unpack = PACKED_PIXELFORMAT_UNPACKERS.get(self.data.pixelFormat)
+        if unpack is not None:
+            return self._unpack(unpack, out)
+        return _copy_to(self.buffer_data_numpy(), out)
+
     def buffer_data(self):
         """
-        Get a copy of the frame's buffer data as a ctypes c_ubyte array.
+        Get the frame's buffer data as a ctypes c_ubyte array. The array views the frame's buffer
+        rather than copying it, so it is overwritten when the frame is requeued.
         """
         # create a ctypes pointer to the buffer
         buffer_ptr = cast(self.data.buffer, POINTER(c_ubyte * self.data.bufferSize))
 
-        # contents always returns a copy
+        # contents refers to the buffer itself, it doesn't copy it
         return buffer_ptr.contents
 
-    def buffer_data_numpy(self) -> np.ndarray:
+    def _image_layout(self) -> Tuple[Tuple[int, ...], type]:
         """
-        Get a copy of the frame's buffer data as a NumPy array. This can easily be used with OpenCV.
+        Gets the (shape, dtype) of the frame's image as a NumPy array.
         """
         # mask the last 4 bytes to reduce pixel format to mono/color mode and bit width info
         pixel_format = self.data.pixelFormat & 0xFFFF0000
@@ -140,7 +293,38 @@ class Frame:
 
         arr_shape = (self.data.height, self.data.width, arr_channels) if arr_channels > 1 \
                     else (self.data.height, self.data.width)
+        return arr_shape, arr_dtype
+
+    def _unpack(self, unpack: Callable[..., np.ndarray],
+                out: Optional[np.ndarray]) -> np.ndarray:
+        """
+        Unpacks the frame's packed image into a new (height, width) uint16 array, or in place into
+        a preallocated one.
+        """
+        arr_shape = (self.data.height, self.data.width)
+        if out is not None and (out.shape != arr_shape or out.dtype != np.uint16):
+            raise ValueError('Output array must have shape {} and dtype uint16, not shape {} and '
+                             'dtype {}.'.format(arr_shape, out.shape, out.dtype))
+
+        packed = np.frombuffer(self._c_memory, dtype=np.uint8, count=self.data.imageSize)
+        image = unpack(packed, arr_shape[0] * arr_shape[1], out)
+        return image.reshape(arr_shape) if out is None else out
+
+    def buffer_data_numpy(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Get the frame's buffer data as a NumPy array shaped by its pixel format, which can easily be
+        used with OpenCV. The array views the frame's buffer rather than copying it, so copy it if
+        it's needed after the frame is requeued. Packed formats, e.g. Mono12Packed, can't be viewed
+        and are unpacked into a new uint16 array instead.
+        :param out: preallocated array to copy the data into instead of viewing the buffer. Must
+        have the shape and dtype of the image.
+        """
+        unpack = PACKED_PIXELFORMAT_UNPACKERS.get(self.data.pixelFormat)
+        if unpack is not None:
+            return self._unpack(unpack, out)
 
-        return np.ndarray(buffer=self.buffer_data(),
-                          dtype=arr_dtype,
-                          shape=arr_shape)
+        arr_shape, arr_dtype = self._image_layout()
+        image = np.ndarray(buffer=self.buffer_data(),
+                           dtype=arr_dtype,
+                           shape=arr_shape)
+        return image if out is None else _copy_to(image, out)
@@ -0,0 +1,122 @@
+import mmap
+from collections import defaultdict
+from ctypes import create_string_buffer
+from typing import Iterable, Optional, Dict, List
+
+
+class FrameAllocator:
+    """
+    Allocates the memory that frames are captured into. Pass to Camera.arm or Frame.announce to
+    control how frame buffers are allocated.
+    """
+
+    # whether a camera may keep the allocated buffers for reuse by later arms
+    pooled = True
+
+    def allocate(self, size: int):
+        """
+        Allocate a frame buffer. Returns a writable, C contiguous object supporting the buffer
+        protocol, e.g. a bytearray, mmap or NumPy array, of at least the requested size. The
+        frame keeps a reference to it for as long as the buffer is announced.
+        :param size: the size of the buffer in bytes.
+        """
+        raise NotImplementedError
+
+
+class DefaultFrameAllocator(FrameAllocator):
+    """
+    Allocates zero filled frame buffers on the heap. This is the default allocator.
+    """
+
+    def allocate(self, size: int):
+        return create_string_buffer(size)
+
+
+class MmapFrameAllocator(FrameAllocator):
+    """
+    Allocates frame buffers as anonymous memory maps, which are page aligned, e.g. for O_DIRECT
+    writes, and aren't zero filled up front, as the OS provides zeroed pages as they are first
+    written. Optionally hints that the maps should be backed by transparent huge pages, reducing
+    TLB misses when processing large frames, where the OS supports it.
+    """
+
+    def __init__(self, huge_pages: bool = False):
+        """
+        :param huge_pages: advise the OS to back the buffers with transparent huge pages.
+        """
+        self._huge_pages = huge_pages
+
+    def allocate(self, size: int):
+        # whole pages are mapped anyway, make them all usable
+        size = -(-size // mmap.PAGESIZE) * mmap.PAGESIZE
+        memory = mmap.mmap(-1, size)
+
+        # madvise is only available from Python 3.8 and on some platforms
+        if self._huge_pages and hasattr(mmap, 'MADV_HUGEPAGE'):
+            memory.madvise(mmap.MADV_HUGEPAGE)
+        return memory
+
+
+class UserFrameAllocator(FrameAllocator):
+    """
+    Hands out frame buffers supplied by the user, e.g. pinned or shared memory, one per frame in
+    the order given. The buffers aren't kept by the camera after it is disarmed unless pooled.
+    """
+
+    def __init__(self, buffers: Iterable, pooled: bool = False):
+        """
+        :param buffers: writable, C contiguous objects supporting the buffer protocol, at least one
+        per frame.
+        :param pooled: let the camera keep the buffers for reuse by later arms.
+        """
+        self._buffers = iter(buffers)
+        self.pooled = pooled
+
+    def allocate(self, size: int):
+        try:
+            buffer = next(self._buffers)
+        except StopIteration:
+            raise ValueError('Not enough user frame buffers were supplied.')
+
+        if memoryview(buffer).nbytes < size:
+            raise ValueError('User frame buffer is smaller than the frame payload size.')
+        return buffer
+
+
+class FrameBufferPool(FrameAllocator):
+    """
+    Keeps released frame buffers for reuse, keyed by size, only allocating new buffers from
+    another allocator when none of the requested size are free. Reused buffers aren't zero filled
+    again.
+    """
+
+    def __init__(self, allocator: Optional[FrameAllocator] = None):
+        """
+        :param allocator: allocator of new buffers, defaults to a DefaultFrameAllocator.
+        """
+        self._allocator = DefaultFrameAllocator() if allocator is None else allocator
+        self._free_buffers: Dict[int, List] = defaultdict(list)
+
+    @property
+    def allocator(self) -> FrameAllocator:
+        return self._allocator
+
+    def allocate(self, size: int):
+        free_buffers = self._free_buffers.get(size)
+        if free_buffers:
+            return free_buffers.pop()
+        return self._allocator.allocate(size)
+
+    def release(self, buffer, size: int) -> None:
+        """
+        Return a buffer to the pool once it is no longer announced.
+        :param buffer: the buffer returned by allocate.
+        :param size: the size the buffer was allocated with.
+        """
+        self._free_buffers[size].append(buffer)
+
+    def clear(self) -> None:
+        """
+        Drop all free buffers so that their memory can be freed.
+        """
+        self._free_buffers.clear()
@@ -83,10 +83,19 @@ class Interface(VimbaObject):
         if error:
             raise VimbaException(error)
 
+        self._reset_feature_cache()
+
     def close(self):
         """
         Close the interface.
         """
+        self.unwatch_all_features()
+        self._shutdown_async_requests()
+        self.unsubscribe_all_feature_invalidations()
+        self._remove_all_feature_invalidation_listeners()
+
         error = vimba_c.vmb_interface_close(self._handle)
         if error:
             raise VimbaException(error)
+
+        self._reset_feature_cache()
@@ -0,0 +1,115 @@
+from typing import Optional, Callable, Dict
+import numpy as np
+
+from .vimba_pixelformat import VmbPixelFormat
+
+
+def _groups(data: np.ndarray, num_pixels: int, pixels_per_group: int,
+            bytes_per_group: int) -> np.ndarray:
+    """
+    Gets packed data as a (groups, bytes per group) uint16 array, zero padding a partial last
+    group.
+    """
+    num_groups = -(-num_pixels // pixels_per_group)
+    num_bytes = num_groups * bytes_per_group
+    if data.size >= num_bytes:
+        groups = data[:num_bytes].astype(np.uint16)
+    else:
+        groups = np.zeros(num_bytes, dtype=np.uint16)
+        groups[:data.size] = data
+    return groups.reshape(num_groups, bytes_per_group)
+
+
+def _output(num_pixels: int, pixels_per_group: int, out: Optional[np.ndarray]) -> np.ndarray:
+    """
+    Gets the array to unpack into as (groups, pixels per group), which views out where possible.
+    """
+    if out is not None:
+        if out.size != num_pixels or out.dtype != np.uint16 or not out.flags.c_contiguous:
+            raise ValueError('Output array must be a C contiguous uint16 array of {} '
+                             'pixels.'.format(num_pixels))
+        if num_pixels % pixels_per_group == 0:
+            return out.reshape(-1, pixels_per_group)
+
+    num_groups = -(-num_pixels // pixels_per_group)
+    return np.empty((num_groups, pixels_per_group), dtype=np.uint16)
+
+
+def _result(unpacked: np.ndarray, num_pixels: int, out: Optional[np.ndarray]) -> np.ndarray:
+    if out is None:
+        return unpacked.reshape(-1)[:num_pixels]
+    if not np.shares_memory(unpacked, out):
+        out.reshape(-1)[:] = unpacked.reshape(-1)[:num_pixels]
+    return out
+
+
+def unpack_10p(data: np.ndarray, num_pixels: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Unpack PFNC 10p data, e.g. Mono10p, where every 4 pixels are packed into 5 bytes least
+    significant bit first, to a flat uint16 array of pixel values.
+    :param data: the packed data as a flat uint8 array.
+    :param num_pixels: the number of pixels to unpack.
+    :param out: preallocated C contiguous uint16 array of num_pixels pixels to unpack into.
+    """
+    b = _groups(data, num_pixels, 4, 5)
+    unpacked = _output(num_pixels, 4, out)
+
+    np.bitwise_or(b[:, 0], (b[:, 1] & 0x03) << 8, out=unpacked[:, 0])
+    np.bitwise_or(b[:, 1] >> 2, (b[:, 2] & 0x0F) << 6, out=unpacked[:, 1])
+    np.bitwise_or(b[:, 2] >> 4, (b[:, 3] & 0x3F) << 4, out=unpacked[:, 2])
+    np.bitwise_or(b[:, 3] >> 6, b[:, 4] << 2, out=unpacked[:, 3])
+    return _result(unpacked, num_pixels, out)
+
+
+def unpack_12p(data: np.ndarray, num_pixels: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Unpack PFNC 12p data, e.g. Mono12p, where every 2 pixels are packed into 3 bytes least
+    significant bit first, to a flat uint16 array of pixel values.
+    :param data: the packed data as a flat uint8 array.
+    :param num_pixels: the number of pixels to unpack.
+    :param out: preallocated C contiguous uint16 array of num_pixels pixels to unpack into.
+    """
+    b = _groups(data, num_pixels, 2, 3)
+    unpacked = _output(num_pixels, 2, out)
+
+    np.bitwise_or(b[:, 0], (b[:, 1] & 0x0F) << 8, out=unpacked[:, 0])
+    np.bitwise_or(b[:, 1] >> 4, b[:, 2] << 4, out=unpacked[:, 1])
+    return _result(unpacked, num_pixels, out)
+
+
+def unpack_12packed(data: np.ndarray, num_pixels: int,
+                    out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Unpack GigE Vision 12Packed data, e.g. Mono12Packed, where every 2 pixels are packed into 3
+    bytes, the first and last byte holding the 8 most significant bits of each pixel and the
+    middle byte their 4 least significant bits, to a flat uint16 array of pixel values.
+    :param data: the packed data as a flat uint8 array.
+    :param num_pixels: the number of pixels to unpack.
+    :param out: preallocated C contiguous uint16 array of num_pixels pixels to unpack into.
+    """
+    b = _groups(data, num_pixels, 2, 3)
+    unpacked = _output(num_pixels, 2, out)
+
+    np.bitwise_or(b[:, 0] << 4, b[:, 1] & 0x0F, out=unpacked[:, 0])
+    np.bitwise_or(b[:, 2] << 4, b[:, 1] >> 4, out=unpacked[:, 1])
+    return _result(unpacked, num_pixels, out)
+
+
+# unpacking function of each packed pixel format, all unpack to a single uint16 channel
+PACKED_PIXELFORMAT_UNPACKERS: Dict[int, Callable[..., np.ndarray]] = {
+    VmbPixelFormat.Mono10p: unpack_10p,
+    VmbPixelFormat.BayerGR10p: unpack_10p,
+    VmbPixelFormat.BayerRG10p: unpack_10p,
+    VmbPixelFormat.BayerGB10p: unpack_10p,
+    VmbPixelFormat.BayerBG10p: unpack_10p,
+    VmbPixelFormat.Mono12p: unpack_12p,
+    VmbPixelFormat.BayerGR12p: unpack_12p,
+    VmbPixelFormat.BayerRG12p: unpack_12p,
+    VmbPixelFormat.BayerGB12p: unpack_12p,
+    VmbPixelFormat.BayerBG12p: unpack_12p,
+    VmbPixelFormat.Mono12Packed: unpack_12packed,
+    VmbPixelFormat.BayerGR12Packed: unpack_12packed,
+    VmbPixelFormat.BayerRG12Packed: unpack_12packed,
+    VmbPixelFormat.BayerGB12Packed: unpack_12packed,
+    VmbPixelFormat.BayerBG12Packed: unpack_12packed,
+}
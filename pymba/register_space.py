@@ -0,0 +1,206 @@
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Optional, Union, List, Tuple
+
+from . import camera as _camera
+
+
+class RegisterSpace:
+    """
+    A bytes like, sliceable view over a region of a camera's memory space. Reads are made in
+    page sized blocks and kept in a small page cache, and writes are buffered and coalesced into
+    as few block transfers as possible when flushed. Use as a context manager to flush pending
+    writes automatically.
+    """
+
+    def __init__(self, camera: '_camera.Camera', address: int, size: int,
+                 page_size: Optional[int] = 4096, max_cached_pages: Optional[int] = 16):
+        """
+        :param camera: the opened camera whose memory to access.
+        :param address: the start address of the region.
+        :param size: the size of the region in bytes.
+        :param page_size: the size of each block read from the camera.
+        :param max_cached_pages: the maximum number of pages to keep cached.
+        """
+        if size < 0 or page_size <= 0 or max_cached_pages < 1:
+            raise ValueError('Invalid register space dimensions.')
+
+        self._camera = camera
+        self._address = address
+        self._size = size
+        self._page_size = page_size
+        self._max_cached_pages = max_cached_pages
+
+        # page index -> page data, in least to most recently used order
+        self._pages = OrderedDict()
+
+        # (offset, data) writes not yet sent to the camera, in the order they were made
+        self._pending_writes: List[Tuple[int, bytes]] = []
+
+    @property
+    def address(self) -> int:
+        return self._address
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bytes__(self) -> bytes:
+        return self.read(0, self._size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type_, value, traceback):
+        self.flush()
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[int, bytes]:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._size)
+            if step == 1:
+                return self.read(start, max(0, stop - start))
+            # read the covering block once and step through it
+            if step > 0:
+                return self.read(start, max(0, stop - start))[::step]
+            return self.read(stop + 1, max(0, start - stop))[::step]
+
+        return self.read(self._index(key), 1)[0]
+
+    def __setitem__(self, key: Union[int, slice], value) -> None:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._size)
+            if step != 1:
+                raise ValueError('Register space slices must be contiguous.')
+            value = bytes(value)
+            if len(value) != max(0, stop - start):
+                raise ValueError('Register space slice assignment can not change its size.')
+            self.write(start, value)
+        else:
+            self.write(self._index(key), bytes((value,)))
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('Register space index out of range.')
+        return index
+
+    def _check_range(self, offset: int, size: int) -> None:
+        if offset < 0 or size < 0 or offset + size > self._size:
+            raise IndexError('Register space range out of range.')
+
+    def read(self, offset: int, size: int) -> bytes:
+        """
+        Read bytes from the region, including any writes not yet flushed.
+        :param offset: the offset from the start of the region.
+        :param size: the number of bytes to read.
+        """
+        self._check_range(offset, size)
+        if not size:
+            return b''
+
+        first_page = offset // self._page_size
+        last_page = (offset + size - 1) // self._page_size
+        self._load_pages(first_page, last_page)
+
+        data = bytearray()
+        for page in range(first_page, last_page + 1):
+            data += self._page(page)
+        start = offset - first_page * self._page_size
+        data = data[start:start + size]
+
+        # overlay writes that haven't been flushed yet
+        for write_offset, write_data in self._pending_writes:
+            lo = max(offset, write_offset)
+            hi = min(offset + size, write_offset + len(write_data))
+            if lo < hi:
+                data[lo - offset:hi - offset] = write_data[lo - write_offset:hi - write_offset]
+
+        return bytes(data)
+
+    def write(self, offset: int, data: bytes) -> None:
+        """
+        Buffer a write to the region. It is sent to the camera when flush is called.
+        :param offset: the offset from the start of the region.
+        :param data: the bytes to write.
+        """
+        data = bytes(data)
+        self._check_range(offset, len(data))
+        if data:
+            self._pending_writes.append((offset, data))
+
+    def flush(self) -> None:
+        """
+        Send all buffered writes to the camera, merging adjacent and overlapping writes into a
+        single block transfer each. Later writes take precedence over earlier ones.
+        """
+        if not self._pending_writes:
+            return
+
+        # merge the written ranges into disjoint blocks
+        blocks = []
+        for offset, data in sorted(self._pending_writes, key=lambda write: write[0]):
+            end = offset + len(data)
+            if blocks and offset <= blocks[-1][1]:
+                blocks[-1][1] = max(blocks[-1][1], end)
+            else:
+                blocks.append([offset, end])
+
+        # fill the blocks from the writes in the order they were made
+        block_starts = list(block[0] for block in blocks)
+        block_data = list(bytearray(end - start) for start, end in blocks)
+        for offset, data in self._pending_writes:
+            i = bisect_right(block_starts, offset) - 1
+            start = offset - block_starts[i]
+            block_data[i][start:start + len(data)] = data
+
+        for (start, end), data in zip(blocks, block_data):
+            self._camera.write_memory(self._address + start, data)
+
+        self._pending_writes = []
+
+        # drop cached pages that were written to, so they are read again from the camera
+        for start, end in blocks:
+            for page in range(start // self._page_size, (end - 1) // self._page_size + 1):
+                self._pages.pop(page, None)
+
+    def invalidate(self) -> None:
+        """
+        Forget all cached pages, e.g. after the camera's memory has been changed by other means.
+        Writes not yet flushed are kept.
+        """
+        self._pages.clear()
+
+    def _page(self, page: int) -> bytearray:
+        self._pages.move_to_end(page)
+        return self._pages[page]
+
+    def _load_pages(self, first_page: int, last_page: int) -> None:
+        """
+        Make sure a range of pages are cached, reading each run of missing pages in a single
+        transfer.
+        """
+        page = first_page
+        while page <= last_page:
+            if page in self._pages:
+                self._pages.move_to_end(page)
+                page += 1
+                continue
+
+            run_end = page
+            while run_end + 1 <= last_page and run_end + 1 not in self._pages:
+                run_end += 1
+
+            start = page * self._page_size
+            end = min((run_end + 1) * self._page_size, self._size)
+            data = self._camera.read_memory(self._address + start, end - start)
+
+            for i in range(page, run_end + 1):
+                offset = (i - page) * self._page_size
+                self._pages[i] = data[offset:offset + self._page_size]
+
+            page = run_end + 1
+
+        # evict the least recently used pages, but never those just requested
+        num_requested = last_page - first_page + 1
+        while len(self._pages) > max(self._max_cached_pages, num_requested):
+            self._pages.popitem(last=False)
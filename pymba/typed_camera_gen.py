@@ -0,0 +1,178 @@
+import keyword
+import re
+from typing import Dict, Tuple, List
+
+from .feature import _FEATURE_DATA_INT, _FEATURE_DATA_FLOAT, _FEATURE_DATA_ENUM, \
+    _FEATURE_DATA_STRING, _FEATURE_DATA_BOOL, _FEATURE_DATA_COMMAND, _FEATURE_DATA_RAW
+from .camera import Camera
+
+
+# Python type of each feature data type, for annotating the generated properties
+_DATA_TYPE_TO_ANNOTATION = {
+    _FEATURE_DATA_INT: 'int',
+    _FEATURE_DATA_FLOAT: 'float',
+    _FEATURE_DATA_ENUM: 'str',
+    _FEATURE_DATA_STRING: 'str',
+    _FEATURE_DATA_BOOL: 'bool',
+    _FEATURE_DATA_RAW: 'bytearray',
+}
+
+# generated classes keyed by (model name, ((feature name, data type), ...))
+_typed_camera_classes: Dict[Tuple[str, Tuple[Tuple[str, int], ...]], type] = {}
+
+
+class _UnboundFeature:
+    """
+    Stands in for a feature of a typed camera until the features are bound to the camera's opened
+    handle, binding them on first access.
+    """
+    __slots__ = ('_camera', '_slot')
+
+    def __init__(self, camera: Camera, slot: str):
+        self._camera = camera
+        self._slot = slot
+
+    def _bind(self):
+        self._camera._bind_features()
+        return getattr(self._camera, self._slot)
+
+    def _getter(self):
+        return self._bind()._getter()
+
+    def _setter(self, value) -> None:
+        self._bind()._setter(value)
+
+
+def _feature_table(camera: Camera) -> List[Tuple[str, int]]:
+    """
+    Gets the (name, data type) of each feature of an opened camera that can be generated as a
+    class member.
+    """
+    table = []
+    for name in camera.feature_names():
+        if not name.isidentifier() or keyword.iskeyword(name) or name.startswith('_') or \
+                hasattr(Camera, name):
+            continue
+        data_type = camera.feature(name).info.featureDataType
+        if data_type in _DATA_TYPE_TO_ANNOTATION or data_type == _FEATURE_DATA_COMMAND:
+            table.append((name, data_type))
+    return table
+
+
+def _class_name(model_name: str) -> str:
+    return 'Camera' + re.sub(r'\W', '_', model_name)
+
+
+def _source(class_name: str, model_name: str, table: List[Tuple[str, int]]) -> str:
+    features = list((name, data_type) for name, data_type in table
+                    if data_type != _FEATURE_DATA_COMMAND)
+    commands = list(name for name, data_type in table if data_type == _FEATURE_DATA_COMMAND)
+
+    lines = [
+        'from pymba.camera import Camera',
+        'from pymba.typed_camera_gen import _UnboundFeature',
+        '',
+        '',
+        'class {}(Camera):'.format(class_name),
+        '    """',
+        '    Typed camera generated for the {} model. Use pymba.typed_camera to create.'.format(
+            model_name),
+        '    """',
+        '    __slots__ = (',
+    ]
+    lines.extend("        '_f_{}',".format(name) for name, _ in features)
+    lines.extend((
+        '    )',
+        '',
+        '    # features are properties, so attributes are set normally',
+        '    __setattr__ = object.__setattr__',
+        '',
+        '    def _bind_features(self) -> None:',
+    ))
+    lines.extend("        self._f_{0} = self.feature('{0}')".format(name) for name, _ in features)
+    if not features:
+        lines.append('        pass')
+    lines.extend((
+        '',
+        '    def _unbind_features(self) -> None:',
+    ))
+    lines.extend("        self._f_{0} = _UnboundFeature(self, '_f_{0}')".format(name)
+                 for name, _ in features)
+    if not features:
+        lines.append('        pass')
+    lines.extend((
+        '',
+        '    def _reset_feature_cache(self) -> None:',
+        '        super()._reset_feature_cache()',
+        '        self._unbind_features()',
+    ))
+
+    for name, data_type in features:
+        annotation = _DATA_TYPE_TO_ANNOTATION[data_type]
+        lines.extend((
+            '',
+            '    @property',
+            '    def {}(self) -> {}:'.format(name, annotation),
+            '        return self._f_{}._getter()'.format(name),
+            '',
+            '    @{}.setter'.format(name),
+            '    def {}(self, value: {}) -> None:'.format(name, annotation),
+            '        self._f_{}._setter(value)'.format(name),
+        ))
+
+    for name in commands:
+        lines.extend((
+            '',
+            '    def {}(self) -> None:'.format(name),
+            "        self.run_feature_command('{}')".format(name),
+        ))
+
+    return '\n'.join(lines) + '\n'
+
+
+def typed_camera_source(camera: Camera) -> str:
+    """
+    Gets the Python source of the typed camera class for an opened camera's model. Writing it to a
+    module allows IDEs to complete feature names.
+    :param camera: the opened camera.
+    """
+    model_name = camera.info.modelName.decode()
+    return _source(_class_name(model_name), model_name, _feature_table(camera))
+
+
+def typed_camera_class(camera: Camera) -> type:
+    """
+    Gets the typed camera class for an opened camera's model, generating it if required. The
+    class is a Camera subclass with a property for each feature and a method for each command
+    feature. Properties are backed by slots holding bound features, so feature access involves no
+    dynamic attribute lookup or feature name checks. Property access always reads from the
+    camera, i.e. bypasses the feature value cache.
+    :param camera: the opened camera.
+    """
+    model_name = camera.info.modelName.decode()
+    table = _feature_table(camera)
+
+    key = model_name, tuple(table)
+    if key not in _typed_camera_classes:
+        class_name = _class_name(model_name)
+        namespace = {}
+        exec(_source(class_name, model_name, table), namespace)
+        _typed_camera_classes[key] = namespace[class_name]
+
+    return _typed_camera_classes[key]
+
+
+def typed_camera(camera: Camera) -> Camera:
+    """
+    Gets a typed camera object for an opened camera, see typed_camera_class. The typed camera
+    shares all state with the camera and should be used in its place, including to close and
+    reopen the camera.
+    :param camera: the opened camera.
+    """
+    cls = typed_camera_class(camera)
+    typed = cls.__new__(cls)
+
+    # share rather than copy state so that both objects remain coherent
+    typed.__dict__ = camera.__dict__
+    typed._unbind_features()
+    return typed
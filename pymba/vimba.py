@@ -46,7 +46,10 @@ class Vimba:
         when an error occurs in the main program. The system will not hang
         on a kernel call after an exception.
         """
-        self.shutdown()
+        try:
+            self._release_system()
+        finally:
+            self.shutdown()
 
     def startup(self):
         """
@@ -56,11 +59,25 @@ class Vimba:
         if error:
             raise VimbaException(error)
 
+        # system feature info from a previous session is no longer valid
+        self._system._reset_feature_cache()
+
         # automatically check for the presence of a GigE transport layer
         if self.system().GeVTLIsPresent:
             self.system().GeVDiscoveryAllDuration = 250
             self.system().GeVDiscoveryAllOnce()
 
+    def _release_system(self) -> None:
+        """
+        Release what the system object holds for the current session, as it doesn't survive a
+        shutdown. Invalidation listeners are removed while they can still be unregistered.
+        """
+        self._system.unwatch_all_features()
+        self._system._shutdown_async_requests()
+        self._system.unsubscribe_all_feature_invalidations()
+        self._system._remove_all_feature_invalidation_listeners()
+        self._system._reset_feature_cache()
+
     @staticmethod
     def shutdown():
         """
@@ -206,10 +206,11 @@ _vimba_lib = dll_loader.LoadLibrary(vimbaC_path)
 
 # ----- The below function signatures are defined in VimbaC.h -----
 
-# callback for frame queue
+# callback for frame queue, the frame is passed by address so that it can be looked up without
+# creating a pointer object per frame
 vmb_frame_callback_func = CALLBACK_FUNCTYPE(None,
-                                            c_void_p,
-                                            POINTER(VmbFrame))
+                                            c_void_p,  # const VmbHandle_t    cameraHandle
+                                            c_void_p)  # VmbFrame_t*          pFrame
 
 # Callback for Invalidation events
 vmb_feature_invalidation_callback_fun = CALLBACK_FUNCTYPE(None,
@@ -266,8 +267,24 @@ vmb_feature_info_query.argtypes = (c_void_p,
                                    POINTER(VmbFeatureInfo),
                                    c_uint32)
 
-# todo VmbFeatureListAffected
-# todo VmbFeatureListSelected
+vmb_feature_list_affected = _vimba_lib.VmbFeatureListAffected
+vmb_feature_list_affected.restype = c_int32
+vmb_feature_list_affected.argtypes = (c_void_p,
+                                      c_char_p,
+                                      POINTER(VmbFeatureInfo),
+                                      c_uint32,
+                                      POINTER(c_uint32),
+                                      c_uint32)
+
+vmb_feature_list_selected = _vimba_lib.VmbFeatureListSelected
+vmb_feature_list_selected.restype = c_int32
+vmb_feature_list_selected.argtypes = (c_void_p,
+                                      c_char_p,
+                                      POINTER(VmbFeatureInfo),
+                                      c_uint32,
+                                      POINTER(c_uint32),
+                                      c_uint32)
+
 # todo VmbFeatureAccessQuery
 
 vmb_feature_int_get = _vimba_lib.VmbFeatureIntGet
@@ -340,9 +357,27 @@ vmb_feature_enum_range_query.argtypes = (c_void_p,
                                          c_uint32,
                                          POINTER(c_uint32))
 
-# todo VmbFeatureEnumIsAvailable
-# todo VmbFeatureEnumAsInt
-# todo VmbFeatureEnumAsString
+vmb_feature_enum_is_available = _vimba_lib.VmbFeatureEnumIsAvailable
+vmb_feature_enum_is_available.restype = c_int32
+vmb_feature_enum_is_available.argtypes = (c_void_p,
+                                          c_char_p,
+                                          c_char_p,
+                                          POINTER(c_bool))
+
+vmb_feature_enum_as_int = _vimba_lib.VmbFeatureEnumAsInt
+vmb_feature_enum_as_int.restype = c_int32
+vmb_feature_enum_as_int.argtypes = (c_void_p,
+                                    c_char_p,
+                                    c_char_p,
+                                    POINTER(c_int64))
+
+vmb_feature_enum_as_string = _vimba_lib.VmbFeatureEnumAsString
+vmb_feature_enum_as_string.restype = c_int32
+vmb_feature_enum_as_string.argtypes = (c_void_p,
+                                       c_char_p,
+                                       c_int64,
+                                       POINTER(c_char_p))
+
 # todo VmbFeatureEnumEntryGet
 
 vmb_feature_string_get = _vimba_lib.VmbFeatureStringGet
@@ -359,7 +394,11 @@ vmb_feature_string_set.argtypes = (c_void_p,
                                    c_char_p,
                                    c_char_p)
 
-# todo VmbFeatureStringMaxlengthQuery
+vmb_feature_string_max_length_query = _vimba_lib.VmbFeatureStringMaxlengthQuery
+vmb_feature_string_max_length_query.restype = c_int32
+vmb_feature_string_max_length_query.argtypes = (c_void_p,
+                                                c_char_p,
+                                                POINTER(c_uint32))
 
 vmb_feature_bool_get = _vimba_lib.VmbFeatureBoolGet
 vmb_feature_bool_get.restype = c_int32
@@ -384,9 +423,26 @@ vmb_feature_command_is_done.argtypes = (c_void_p,
                                         c_char_p,
                                         POINTER(c_bool))
 
-# todo VmbFeatureRawGet
-# todo VmbFeatureRawSet
-# todo VmbFeatureRawLengthQuery
+vmb_feature_raw_get = _vimba_lib.VmbFeatureRawGet
+vmb_feature_raw_get.restype = c_int32
+vmb_feature_raw_get.argtypes = (c_void_p,
+                                c_char_p,
+                                c_char_p,
+                                c_uint32,
+                                POINTER(c_uint32))
+
+vmb_feature_raw_set = _vimba_lib.VmbFeatureRawSet
+vmb_feature_raw_set.restype = c_int32
+vmb_feature_raw_set.argtypes = (c_void_p,
+                                c_char_p,
+                                c_char_p,
+                                c_uint32)
+
+vmb_feature_raw_length_query = _vimba_lib.VmbFeatureRawLengthQuery
+vmb_feature_raw_length_query.restype = c_int32
+vmb_feature_raw_length_query.argtypes = (c_void_p,
+                                         c_char_p,
+                                         POINTER(c_uint32))
 
 vmb_feature_invalidation_register = _vimba_lib.VmbFeatureInvalidationRegister
 vmb_feature_invalidation_register.restype = c_int32
@@ -465,8 +521,21 @@ vmb_ancillary_data_close = _vimba_lib.VmbAncillaryDataClose
 vmb_interface_close.restype = c_int32
 vmb_interface_close.argtypes = (c_void_p, )
 
-# todo VmbMemoryRead
-# todo VmbMemoryWrite
+vmb_memory_read = _vimba_lib.VmbMemoryRead
+vmb_memory_read.restype = c_int32
+vmb_memory_read.argtypes = (c_void_p,
+                            c_uint64,
+                            c_uint32,
+                            c_char_p,
+                            POINTER(c_uint32))
+
+vmb_memory_write = _vimba_lib.VmbMemoryWrite
+vmb_memory_write.restype = c_int32
+vmb_memory_write.argtypes = (c_void_p,
+                             c_uint64,
+                             c_uint32,
+                             c_char_p,
+                             POINTER(c_uint32))
 
 vmb_registers_read = _vimba_lib.VmbRegistersRead
 vmb_registers_read.restype = c_int32
@@ -1,8 +1,19 @@
-from ctypes import byref, sizeof, c_void_p, c_uint32, c_uint64, c_bool
-from typing import List, Optional, Callable, Dict, Tuple
+from concurrent.futures import Future
+from ctypes import byref, sizeof, c_void_p, c_uint32, c_uint64, c_bool, c_char, POINTER
+from collections import defaultdict
+from fnmatch import fnmatchcase
+from typing import List, Optional, Callable, Dict, Tuple, Iterable, Any, Mapping, Sequence, \
+    Union
+import numpy as np
 
 from .vimba_exception import VimbaException
-from .feature import Feature, _FEATURE_DATA_COMMAND
+from .feature import Feature, FeatureAccessor, _FEATURE_DATA_COMMAND, _FEATURE_FLAGS_READ, \
+    _read_values
+from .feature_tree import FeatureTree
+from .feature_poller import FeatureWatch, _poller
+from . import feature_commands as _feature_commands
+from .feature_async import _AsyncFeatureRequests, _GET, _GET_MANY, _SET
+from .feature_subscriptions import FeatureSubscription, _FeatureInvalidationHub
 from . import vimba_c
 
 
@@ -23,11 +34,22 @@ class VimbaObject:
         self._handle = c_void_p(handle)
 
         self._features = {}
-        self._feature_invalidation_callbacks: Dict[str, Tuple[Callable, Callable]] = dict()
+        self._feature_info_index: Optional[Dict[str, vimba_c.VmbFeatureInfo]] = None
+        self._feature_tree: Optional[FeatureTree] = None
+        self._feature_invalidation_callbacks: Dict[str, List[Tuple[Callable, FeatureSubscription]]] \
+            = dict()
+        self._feature_invalidation_listeners: Dict[str, Tuple[List[Callable], Callable]] = dict()
+        self._feature_watches: List[FeatureWatch] = []
+        self._feature_invalidation_hub = _FeatureInvalidationHub(self)
+        self._async_feature_requests: Optional[_AsyncFeatureRequests] = None
 
     def __getattr__(self, item: str):
+        # privates are never features, don't list features when probing for them
+        if item.startswith('_'):
+            raise AttributeError('{} object has no attribute {}'.format(self.__class__.__name__, item))
+
         # allow direct access to feature values as an attribute
-        if item in self.feature_names():
+        if item in self._feature_index():
             feature = self.feature(item)
 
             # command feature types are a special case, return a callable
@@ -35,7 +57,7 @@ class VimbaObject:
                 return lambda: self.run_feature_command(item)
 
             # otherwise attempt to get their value
-            return feature.value
+            return self._get_feature_value(item, feature)
 
         raise AttributeError('{} object has no attribute {}'.format(self.__class__.__name__, item))
 
@@ -46,57 +68,124 @@ class VimbaObject:
             super().__setattr__(item, value)
 
         # allow direct access to feature values as an attribute
-        elif item in self.feature_names():
-            self.feature(item).value = value
+        elif item in self._feature_index():
+            self._set_feature_value(item, self.feature(item), value)
 
         else:
             super().__setattr__(item, value)
 
-    def _feature_infos(self) -> List[vimba_c.VmbFeatureInfo]:
+    def _num_features(self) -> int:
         """
-        Gets feature info of all available features. Will cause error if object/camera/etc is not
-        opened.
+        Gets the number of available features without listing them.
         """
-        # call once to get number of available features
-        vmb_feature_info = vimba_c.VmbFeatureInfo()
         num_found = c_uint32(-1)
         error = vimba_c.vmb_features_list(self._handle,
                                           None,
                                           0,
                                           byref(num_found),
-                                          sizeof(vmb_feature_info))
+                                          sizeof(vimba_c.VmbFeatureInfo))
         if error:
             raise VimbaException(error)
 
+        return num_found.value
+
+    def _feature_infos(self) -> List[vimba_c.VmbFeatureInfo]:
+        """
+        Gets feature info of all available features. Will cause error if object/camera/etc is not
+        opened.
+        """
+        # call once to get number of available features
+        num_features = self._num_features()
+
         # call again to get the features
-        num_features = num_found.value
+        num_found = c_uint32(-1)
         vmb_feature_infos = (vimba_c.VmbFeatureInfo * num_features)()
         error = vimba_c.vmb_features_list(self._handle,
                                           vmb_feature_infos,
                                           num_features,
                                           byref(num_found),
-                                          sizeof(vmb_feature_info))
+                                          sizeof(vimba_c.VmbFeatureInfo))
         if error:
             raise VimbaException(error)
 
         return list(vmb_feature_info for vmb_feature_info in vmb_feature_infos)
 
+    def _get_feature_value(self, feature_name: str, feature: Feature):
+        """
+        Get a feature value on attribute access. Allows subclasses to answer reads differently.
+        :param feature_name: the name of the feature.
+        :param feature: the feature object.
+        """
+        return feature.value
+
+    def _set_feature_value(self, feature_name: str, feature: Feature, value) -> None:
+        """
+        Set a feature value on attribute assignment. Allows subclasses to handle writes
+        differently.
+        :param feature_name: the name of the feature.
+        :param feature: the feature object.
+        :param value: the value to set.
+        """
+        feature.value = value
+
+    def _feature_index(self) -> Dict[str, vimba_c.VmbFeatureInfo]:
+        """
+        Gets feature info of all available features indexed by feature name. The index is built
+        once per opened handle and reused until the object is reopened or closed.
+        """
+        if self._feature_info_index is None:
+            self._feature_info_index = {vmb_feature_info.name.decode(): vmb_feature_info
+                                        for vmb_feature_info in self._feature_infos()}
+        return self._feature_info_index
+
+    def _reset_feature_cache(self) -> None:
+        """
+        Forget all cached feature info and feature objects. Must be called whenever the handle is
+        opened or closed as the cached info is only valid for the lifetime of a handle.
+        """
+        for feature in self._features.values():
+            feature._forget_limits()
+
+        self._feature_info_index = None
+        self._feature_tree = None
+        self._features = {}
+
+    def _restore_feature_cache(self, feature_infos: Dict[str, vimba_c.VmbFeatureInfo],
+                               features: Dict[str, Feature]) -> None:
+        """
+        Use previously gathered feature info and feature objects instead of listing the features
+        of the opened handle.
+        :param feature_infos: feature info of all available features, keyed by feature name.
+        :param features: feature objects to use, keyed by feature name.
+        """
+        self._feature_info_index = feature_infos
+        self._feature_tree = None
+        self._features = features
+
     def _feature_info(self, feature_name: str) -> vimba_c.VmbFeatureInfo:
         """
         Gets feature info object of specified feature.
         :param feature_name: the name of the feature.
         """
-        for vmb_feature_info in self._feature_infos():
-            if feature_name == vmb_feature_info.name.decode():
-                return vmb_feature_info
-        raise VimbaException(VimbaException.ERR_INSTANCE_NOT_FOUND)
+        try:
+            return self._feature_index()[feature_name]
+        except KeyError:
+            raise VimbaException(VimbaException.ERR_INSTANCE_NOT_FOUND)
 
     def feature_names(self) -> List[str]:
         """
         Get names of all available features.
         """
-        return list(vmb_feature_info.name.decode()
-                    for vmb_feature_info in self._feature_infos())
+        return list(self._feature_index())
+
+    def feature_tree(self) -> FeatureTree:
+        """
+        Gets the features indexed by name, category and visibility. The tree is built once per
+        opened handle, see FeatureTree.
+        """
+        if self._feature_tree is None:
+            self._feature_tree = FeatureTree(self._feature_index())
+        return self._feature_tree
 
     def feature(self, feature_name: str) -> Feature:
         """
@@ -107,11 +196,180 @@ class VimbaObject:
             return self._features[feature_name]
 
         # cache feature
-        feature = Feature(feature_name, self._handle)
+        feature = Feature(feature_name, self._handle, self._feature_info(feature_name),
+                          self._add_feature_invalidation_listener)
         self._features[feature_name] = feature
 
         return feature
 
+    def accessor(self, feature_name: str) -> FeatureAccessor:
+        """
+        Gets a lightweight accessor for fast repeated gets and sets of a feature value, e.g. in a
+        control loop. See FeatureAccessor.
+        :param feature_name: the name of the feature.
+        """
+        return FeatureAccessor(self.feature(feature_name))
+
+    def get_features(self, feature_names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Get the values of many features in one pass. Features are grouped by data type so that
+        each group is read with a single reused out parameter. Features that are unknown, not
+        readable, have no value (e.g. commands) or fail to be read are left out of the result
+        rather than raising.
+        :param feature_names: names of the features to get, or None for all features.
+        """
+        index = self._feature_index()
+        if feature_names is None:
+            feature_names = index
+
+        names_by_data_type = defaultdict(list)
+        for feature_name in feature_names:
+            vmb_feature_info = index.get(feature_name)
+            if vmb_feature_info is not None and vmb_feature_info.featureFlags & _FEATURE_FLAGS_READ:
+                names_by_data_type[vmb_feature_info.featureDataType].append(feature_name)
+
+        values = {}
+        for data_type, names in names_by_data_type.items():
+            _read_values(self._handle, data_type, names, values)
+
+        return values
+
+    def _async_requests(self) -> _AsyncFeatureRequests:
+        if self._async_feature_requests is None:
+            self._async_feature_requests = _AsyncFeatureRequests(self)
+        return self._async_feature_requests
+
+    def _shutdown_async_requests(self) -> None:
+        if self._async_feature_requests is not None:
+            self._async_feature_requests.shutdown()
+            self._async_feature_requests = None
+
+    async def aget(self, feature_name: str) -> Any:
+        """
+        Get a feature value from asyncio code. Requests of a Vimba object are run in order on its
+        own worker thread, and the values of gets queued together are read in a single batch.
+        :param feature_name: the name of the feature.
+        """
+        return await self._async_requests().request(_GET, [feature_name])
+
+    async def aget_many(self, feature_names: Iterable[str]) -> Dict[str, Any]:
+        """
+        Get many feature values from asyncio code, see aget and get_features.
+        :param feature_names: names of the features to get.
+        """
+        return await self._async_requests().request(_GET_MANY, list(feature_names))
+
+    async def aset(self, feature_name: str, value) -> None:
+        """
+        Set a feature value from asyncio code, see aget.
+        :param feature_name: the name of the feature.
+        :param value: the value to set.
+        """
+        await self._async_requests().request(_SET, [feature_name], value)
+
+    def _feature_write_order(self, feature_names: List[str]) -> List[str]:
+        """
+        Order feature names so that features are written before the features they affect or
+        select. Where no order can be determined (e.g. features affecting each other) the given
+        order is kept.
+        :param feature_names: names of the features to order.
+        """
+        # edges from each feature to the features that should be written after it
+        dependants = {}
+        num_dependencies = dict.fromkeys(feature_names, 0)
+        for feature_name in feature_names:
+            feature = self.feature(feature_name)
+            dependants[feature_name] = list(
+                name for name in feature.selected_feature_names + feature.affected_feature_names
+                if name in num_dependencies and name != feature_name)
+            for name in dependants[feature_name]:
+                num_dependencies[name] += 1
+
+        ordered = []
+        remaining = list(feature_names)
+        while remaining:
+            # take the first feature without outstanding dependencies, or break a cycle by taking
+            # the first remaining feature
+            feature_name = next((name for name in remaining if not num_dependencies[name]),
+                                remaining[0])
+            remaining.remove(feature_name)
+            ordered.append(feature_name)
+            for name in dependants[feature_name]:
+                num_dependencies[name] -= 1
+
+        return ordered
+
+    def _write_features(self, feature_names: List[str], feature_values: Mapping[str, Any],
+                        current_values: Dict[str, Any], written: List[str]) -> None:
+        """
+        Write feature values in the given order, skipping features that already have the value.
+        Failed writes are retried after the remaining writes until no further progress is made, at
+        which point the last error is raised.
+        :param feature_names: names of the features to write, in write order.
+        :param feature_values: feature values keyed by feature name.
+        :param current_values: known current values keyed by feature name, updated as features
+        are written.
+        :param written: list that the names of written features are appended to.
+        """
+        # features that may have changed since being read as a result of earlier writes
+        stale_feature_names = set()
+
+        pending = feature_names
+        while pending:
+            failed = []
+            error = None
+            for feature_name in pending:
+                feature = self.feature(feature_name)
+                value = feature_values[feature_name]
+
+                if feature_name in stale_feature_names and feature_name in current_values:
+                    current_values[feature_name] = feature.value
+                    stale_feature_names.discard(feature_name)
+
+                if feature_name in current_values and current_values[feature_name] == value:
+                    continue
+
+                try:
+                    feature.value = value
+                except VimbaException as e:
+                    failed.append(feature_name)
+                    error = e
+                else:
+                    written.append(feature_name)
+                    current_values[feature_name] = value
+                    stale_feature_names.update(feature.affected_feature_names)
+
+            # give up once no further progress is being made
+            if len(failed) == len(pending):
+                raise error
+            pending = failed
+
+    def set_features(self, feature_values: Mapping[str, Any]) -> None:
+        """
+        Set many feature values at once. Features are written before the features they affect or
+        select, e.g. PixelFormat and Binning before Width, Height and the offsets. Features that
+        already have the requested value are not written. Writes that fail are retried after the
+        remaining writes, as writing other features may make the value valid. If a write still
+        fails then the features written so far are restored to their previous values and the
+        error is raised.
+        :param feature_values: feature values keyed by feature name.
+        """
+        feature_names = self._feature_write_order(list(feature_values))
+        previous_values = self.get_features(feature_names)
+
+        written = []
+        try:
+            self._write_features(feature_names, feature_values, dict(previous_values), written)
+        except VimbaException:
+            # best effort restore, write only features can't be restored
+            restore_names = list(feature_name for feature_name in reversed(written)
+                                 if feature_name in previous_values)
+            try:
+                self._write_features(restore_names, previous_values, {}, [])
+            except VimbaException:
+                pass
+            raise
+
     def run_feature_command(self, feature_name: str) -> None:
         """
         Run a feature command.
@@ -132,10 +390,22 @@ class VimbaObject:
 
         return is_done.value
 
+    def run_feature_command_async(self, feature_name: str,
+                                  timeout: Optional[float] = None) -> Future:
+        """
+        Run a feature command and get a future that completes once the command is done, rather
+        than polling feature_command_is_done. Completion of the commands of all Vimba objects is
+        polled on a single shared thread, with a backoff for commands that take longer. See
+        pymba.run_feature_commands_async to run a command on many objects at once.
+        :param feature_name: the name of the feature.
+        :param timeout: time in seconds after which a command that isn't done fails with a timeout
+        error.
+        """
+        return _feature_commands.run_feature_command_async(self, feature_name, timeout)
+
     # todo test
     def read_register(self, address: int) -> int:
-        # note that the underlying Vimba function allows reading of an array of registers, but only
-        # one address/value at a time is implemented here
+        # see read_registers to read many registers in a single call
         """
         Read from a register of the module (camera) and return its value.
         :param address: the address of the register to read.
@@ -156,8 +426,7 @@ class VimbaObject:
 
     # todo test
     def write_register(self, address: int, value: int) -> None:
-        # note that the underlying Vimba function allows writing of an array of registers, but only
-        # one address/value at a time is implemented here
+        # see write_registers to write many registers in a single call
         """
         Write to a register of the module (camera).
         :param address: the address of the register to read.
@@ -175,38 +444,284 @@ class VimbaObject:
         if error:
             raise VimbaException(error)
 
-    def register_feature_invalidation_callback(self, name, frame_callback: Callable[['VimbaObject',
-                                                                                     str], None]):
-        def frame_callback_wrapper(handle, feature_name: bytes, user_data_ptr):
-            feature_name = feature_name.decode()
-            self._feature_invalidation_callbacks[feature_name][0](self, feature_name)
+    def read_registers(self, addresses: Union[Sequence[int], np.ndarray],
+                       allow_partial: Optional[bool] = False) -> np.ndarray:
+        """
+        Read from many registers of the module (camera) in a single call and return their values
+        as a NumPy uint64 array.
+        :param addresses: the addresses of the registers to read.
+        :param allow_partial: if True, a partially completed read returns only the values that
+        were read (the first len(result) addresses) rather than raising.
+        """
+        reg_addresses = np.ascontiguousarray(addresses, dtype=np.uint64).ravel()
+        reg_data = np.empty_like(reg_addresses)
+        num_complete_reads = c_uint32()
+        error = vimba_c.vmb_registers_read(self._handle,
+                                           reg_addresses.size,
+                                           reg_addresses.ctypes.data_as(POINTER(c_uint64)),
+                                           reg_data.ctypes.data_as(POINTER(c_uint64)),
+                                           byref(num_complete_reads))
+        if error and not (allow_partial and error == VimbaException.ERR_PARTIAL_REGISTER_ACCESS):
+            raise VimbaException(error)
 
-        if name in self._feature_invalidation_callbacks:
-            raise RuntimeError("Can only register one callback per feature and handle.")
+        return reg_data[:num_complete_reads.value]
 
-        c_callback = vimba_c.vmb_feature_invalidation_callback_fun(frame_callback_wrapper)
+    def write_registers(self, addresses: Union[Sequence[int], np.ndarray],
+                        values: Union[Sequence[int], np.ndarray],
+                        allow_partial: Optional[bool] = False) -> int:
+        """
+        Write to many registers of the module (camera) in a single call. Returns the number of
+        registers written, which are always the first ones given.
+        :param addresses: the addresses of the registers to write.
+        :param values: the values to write, one per address.
+        :param allow_partial: if True, a partially completed write returns the number of registers
+        written rather than raising.
+        """
+        reg_addresses = np.ascontiguousarray(addresses, dtype=np.uint64).ravel()
+        reg_data = np.ascontiguousarray(values, dtype=np.uint64).ravel()
+        if reg_addresses.size != reg_data.size:
+            raise ValueError('Number of addresses and values must be equal.')
 
-        self._feature_invalidation_callbacks[name] = frame_callback, c_callback
+        num_complete_writes = c_uint32()
+        error = vimba_c.vmb_registers_write(self._handle,
+                                            reg_addresses.size,
+                                            reg_addresses.ctypes.data_as(POINTER(c_uint64)),
+                                            reg_data.ctypes.data_as(POINTER(c_uint64)),
+                                            byref(num_complete_writes))
+        if error and not (allow_partial and error == VimbaException.ERR_PARTIAL_REGISTER_ACCESS):
+            raise VimbaException(error)
 
-        try:
+        return num_complete_writes.value
+
+    def read_memory_into(self, address: int, buffer) -> None:
+        """
+        Read a block of the module's (camera's) memory directly into a writable buffer, filling
+        it completely. Raises if the read is only partially completed.
+        :param address: the start address of the block to read.
+        :param buffer: a writable, C contiguous object supporting the buffer protocol, e.g. a
+        bytearray.
+        """
+        size = memoryview(buffer).nbytes
+        size_complete = c_uint32()
+        error = vimba_c.vmb_memory_read(self._handle,
+                                        address,
+                                        size,
+                                        (c_char * size).from_buffer(buffer),
+                                        byref(size_complete))
+        if error:
+            raise VimbaException(error)
+
+        # the rest of the buffer would otherwise pass for camera memory
+        if size_complete.value != size:
+            raise VimbaException(VimbaException.ERR_PARTIAL_REGISTER_ACCESS)
+
+    def read_memory(self, address: int, size: int) -> bytearray:
+        """
+        Read a block of the module's (camera's) memory in a single transfer.
+        :param address: the start address of the block to read.
+        :param size: the number of bytes to read.
+        """
+        buffer = bytearray(size)
+        self.read_memory_into(address, buffer)
+        return buffer
+
+    def write_memory(self, address: int, data: bytes) -> None:
+        """
+        Write a block of the module's (camera's) memory in a single transfer. Raises if the write
+        is only partially completed.
+        :param address: the start address of the block to write.
+        :param data: the bytes to write.
+        """
+        data = bytes(data)
+        size_complete = c_uint32()
+        error = vimba_c.vmb_memory_write(self._handle,
+                                         address,
+                                         len(data),
+                                         data,
+                                         byref(size_complete))
+        if error:
+            raise VimbaException(error)
+
+        if size_complete.value != len(data):
+            raise VimbaException(VimbaException.ERR_PARTIAL_REGISTER_ACCESS)
+
+    def _add_feature_invalidation_listener(self, name: str,
+                                           listener: Callable[[str], None]) -> None:
+        """
+        Add a function to be called with the feature name whenever the feature is invalidated.
+        Any number of listeners may be added per feature, sharing a single registration with the
+        Vimba C API. Listeners are called on the Vimba callback thread.
+        :param name: the name of the feature.
+        :param listener: the function to call.
+        """
+        if name not in self._feature_invalidation_listeners:
+            listeners = []
+
+            # bind the listener list rather than decoding the name and looking it up per event
+            def invalidation_callback(handle, feature_name: bytes, user_data_ptr):
+                for listener_ in tuple(listeners):
+                    listener_(name)
+
+            c_callback = vimba_c.vmb_feature_invalidation_callback_fun(invalidation_callback)
             error = vimba_c.vmb_feature_invalidation_register(self._handle, name.encode(),
                                                               c_callback, c_void_p(0))
             if error:
                 raise VimbaException(error)
-        except:
-            del self._feature_invalidation_callbacks[name]
-            raise
 
-    def unregister_feature_invalidation_callback(self, name):
+            # keep a reference to the C callback to prevent gc issues
+            self._feature_invalidation_listeners[name] = listeners, c_callback
+
+        self._feature_invalidation_listeners[name][0].append(listener)
+
+    def _remove_feature_invalidation_listener(self, name: str,
+                                              listener: Callable[[str], None]) -> None:
+        """
+        Remove a function added with _add_feature_invalidation_listener, unregistering from the
+        Vimba C API once no listeners remain for the feature.
+        :param name: the name of the feature.
+        :param listener: the function to remove.
+        """
+        listeners, c_callback = self._feature_invalidation_listeners[name]
+        listeners.remove(listener)
+
+        if not listeners:
+            del self._feature_invalidation_listeners[name]
+            error = vimba_c.vmb_feature_invalidation_unregister(self._handle, name.encode(),
+                                                                c_callback)
+            if error:
+                raise VimbaException(error)
+
+    def _remove_all_feature_invalidation_listeners(self) -> None:
+        """
+        Remove all invalidation listeners of all features, e.g. before closing the handle.
+        """
+        for name in list(self._feature_invalidation_listeners):
+            listeners, c_callback = self._feature_invalidation_listeners.pop(name)
+            error = vimba_c.vmb_feature_invalidation_unregister(self._handle, name.encode(),
+                                                                c_callback)
+            if error:
+                raise VimbaException(error)
+
+    def subscribe_feature_invalidations(self, callback: Callable[['VimbaObject', str], None],
+                                        pattern: str = '*', category: Optional[str] = None,
+                                        debounce: float = 0.0) -> FeatureSubscription:
+        """
+        Call a function whenever a feature's value, range or availability changes. Any number of
+        subscriptions may be made per feature. Events are delivered on a dispatcher thread shared
+        by all Vimba objects, never on the Vimba callback thread, and events of a feature that are
+        still queued for a subscription are delivered once. Returns the subscription, cancel it to
+        unsubscribe.
+        :param callback: function called as callback(vimba object, feature name).
+        :param pattern: a feature name, or a wildcard pattern such as 'Acquisition*' matching the
+        names of the features to subscribe to.
+        :param category: if given, only subscribe to features in this category or its
+        subcategories, e.g. '/ImageFormat'.
+        :param debounce: if given, repeated events of a feature within this many seconds of its
+        first event are delivered once, e.g. to collect the bursts of events of a ROI change.
+        """
+        feature_tree = self.feature_tree()
+        if category is not None:
+            feature_names = feature_tree.category_names(category, recursive=True)
+        elif any(char in pattern for char in '*?['):
+            # only match names starting with the pattern's literal prefix
+            prefix = pattern[:min(pattern.find(char) for char in '*?[' if char in pattern)]
+            feature_names = feature_tree.names_with_prefix(prefix)
+        else:
+            feature_names = [pattern]
+
+        if pattern != '*':
+            feature_names = list(name for name in feature_names if fnmatchcase(name, pattern))
+
+        return self._feature_invalidation_hub.subscribe(feature_names, callback, debounce)
+
+    def unsubscribe_all_feature_invalidations(self) -> None:
+        """
+        Cancel all subscriptions to feature invalidations, including registered callbacks.
+        """
+        self._feature_invalidation_hub.unsubscribe_all()
+        self._feature_invalidation_callbacks.clear()
+
+    def register_feature_invalidation_callback(self, name, frame_callback: Callable[['VimbaObject',
+                                                                                     str], None]):
+        """
+        Call a function whenever a feature is invalidated, see subscribe_feature_invalidations.
+        Any number of callbacks may be registered per feature.
+        :param name: the name of the feature.
+        :param frame_callback: function called as frame_callback(vimba object, feature name).
+        """
+        subscription = self._feature_invalidation_hub.subscribe([name], frame_callback, 0.0)
+        self._feature_invalidation_callbacks.setdefault(name, []).append((frame_callback,
+                                                                          subscription))
+
+    def unregister_feature_invalidation_callback(self, name,
+                                                 frame_callback: Optional[Callable] = None):
+        """
+        Unregister callbacks registered with register_feature_invalidation_callback.
+        :param name: the name of the feature.
+        :param frame_callback: the callback to unregister, or None to unregister all callbacks of
+        the feature.
+        """
         if name not in self._feature_invalidation_callbacks:
             raise KeyError('No callback registered on name')
 
-        frame_callback, c_callback = self._feature_invalidation_callbacks[name]
+        callbacks = self._feature_invalidation_callbacks.pop(name)
+        remaining = []
+        for callback, subscription in callbacks:
+            if frame_callback is None or callback is frame_callback:
+                subscription.cancel()
+            else:
+                remaining.append((callback, subscription))
 
-        error = vimba_c.vmb_feature_invalidation_unregister(self._handle, name.encode(), c_callback)
-        if error:
-            raise VimbaException(error)
+        if len(remaining) == len(callbacks):
+            self._feature_invalidation_callbacks[name] = remaining
+            raise KeyError('Callback not registered on name')
+        if remaining:
+            self._feature_invalidation_callbacks[name] = remaining
 
     def unregister_all_feature_invalidation_callbacks(self):
-        for name in self._feature_invalidation_callbacks:
-            self.unregister_feature_invalidation_callback(name)
\ No newline at end of file
+        for name in list(self._feature_invalidation_callbacks):
+            self.unregister_feature_invalidation_callback(name)
+
+    def watch_feature(self, feature_name: str, interval: float,
+                      callback: Optional[Callable[['VimbaObject', str, Any], None]] = None,
+                      queue=None) -> FeatureWatch:
+        """
+        Poll the value of a feature in the background and report each change, e.g. for volatile
+        features such as DeviceTemperature that raise no invalidation events. The features of all
+        Vimba objects are polled on a single shared thread, and features falling due together are
+        read in the same pass, each only once. Returns the watch, cancel it to stop watching.
+        :param feature_name: the name of the feature.
+        :param interval: the time between reads in seconds.
+        :param callback: function called on the poller thread as callback(vimba object, feature
+        name, value) whenever the value changes.
+        :param queue: queue, e.g. a queue.Queue, to put (vimba object, feature name, value) to
+        whenever the value changes.
+        """
+        if interval <= 0:
+            raise ValueError('Watch interval must be positive.')
+        if callback is None and queue is None:
+            raise ValueError('A callback or queue is required to watch a feature.')
+
+        vmb_feature_info = self._feature_info(feature_name)
+        if vmb_feature_info.featureDataType == _FEATURE_DATA_COMMAND:
+            raise VimbaException(VimbaException.ERR_COMMAND_MUST_BE_CALLED)
+
+        # the watch owns its feature object so that reads never share buffers with other threads
+        accessor = FeatureAccessor(Feature(feature_name, self._handle, vmb_feature_info))
+        watch = FeatureWatch(self, feature_name, accessor, interval, callback, queue)
+        self._feature_watches.append(watch)
+        _poller.add(watch)
+        return watch
+
+    def unwatch_feature(self, watch: FeatureWatch) -> None:
+        """
+        Stop watching a feature.
+        :param watch: the watch returned by watch_feature.
+        """
+        if watch in self._feature_watches:
+            self._feature_watches.remove(watch)
+            _poller.remove(watch)
+
+    def unwatch_all_features(self) -> None:
+        for watch in list(self._feature_watches):
+            self.unwatch_feature(watch)
@@ -0,0 +1,20 @@
+import pytest
+
+
+# importing pymba loads VimbaC, so the tests can't run without it, even those using no camera
+try:
+    import pymba
+    _vimba_c_error = None
+except (AssertionError, OSError) as e:
+    _vimba_c_error = str(e)
+
+
+class _SkippedModule(pytest.Module):
+
+    def collect(self):
+        pytest.skip('VimbaC can not be loaded: {}'.format(_vimba_c_error))
+
+
+def pytest_pycollect_makemodule(module_path, parent):
+    if _vimba_c_error is not None:
+        return _SkippedModule.from_parent(parent, path=module_path)
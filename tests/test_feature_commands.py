@@ -0,0 +1,101 @@
+import time
+from typing import Optional
+import pytest
+from pymba import VimbaException, run_feature_commands_async
+from pymba.vimba_object import VimbaObject
+from pymba import feature_commands
+from pymba import vimba_c
+
+
+class FakeCommands:
+    # stands in for the Vimba C command functions, with commands done a set time after being run
+
+    def __init__(self, duration: Optional[float]):
+        self.duration = duration
+        self.run_at = {}
+        self.polls = []
+        self.failing_handles = set()
+
+    def vmb_feature_command_run(self, handle, name: bytes) -> int:
+        if handle.value in self.failing_handles:
+            return VimbaException.ERR_RESOURCE_NOT_AVAILABLE
+        self.run_at[handle.value] = time.monotonic()
+        return 0
+
+    def vmb_feature_command_is_done(self, handle, name: bytes, is_done) -> int:
+        now = time.monotonic()
+        self.polls.append(now)
+        is_done._obj.value = self.duration is not None and \
+            now - self.run_at[handle.value] >= self.duration
+        return 0
+
+
+def fake_commands(monkeypatch, duration: Optional[float]) -> FakeCommands:
+    commands = FakeCommands(duration)
+    monkeypatch.setattr(vimba_c, 'vmb_feature_command_run', commands.vmb_feature_command_run)
+    monkeypatch.setattr(vimba_c, 'vmb_feature_command_is_done',
+                        commands.vmb_feature_command_is_done)
+    return commands
+
+
+def test_command_done(monkeypatch):
+    commands = fake_commands(monkeypatch, 0.0)
+    future = VimbaObject(None, 1).run_feature_command_async('AcquisitionStart')
+    assert future.result(1) is None
+    assert len(commands.polls) == 1
+
+
+def test_backoff(monkeypatch):
+    commands = fake_commands(monkeypatch, 0.3)
+    VimbaObject(None, 1).run_feature_command_async('GVSPAdjustPacketSize').result(1)
+
+    # polling slows down to the maximum delay rather than spinning for the whole command
+    delays = list(b - a for a, b in zip(commands.polls, commands.polls[1:]))
+    assert delays[0] < feature_commands._MAX_POLL_DELAY / 4
+    assert delays[-1] >= feature_commands._MAX_POLL_DELAY * 0.9
+    assert len(commands.polls) < 0.3 / feature_commands._MAX_POLL_DELAY + 10
+
+
+def test_timeout(monkeypatch):
+    fake_commands(monkeypatch, None)
+    start = time.monotonic()
+    future = VimbaObject(None, 1).run_feature_command_async('GVSPAdjustPacketSize', timeout=0.1)
+
+    with pytest.raises(VimbaException) as e:
+        future.result(1)
+    assert e.value.error_code == VimbaException.ERR_TIMEOUT
+
+    # the last poll is brought forward to the deadline rather than waiting out the delay
+    assert 0.1 <= time.monotonic() - start < 0.1 + feature_commands._MAX_POLL_DELAY
+
+
+def test_poll_error(monkeypatch):
+    fake_commands(monkeypatch, None)
+    monkeypatch.setattr(vimba_c, 'vmb_feature_command_is_done',
+                        lambda handle, name, is_done: VimbaException.ERR_HANDLE_INVALID)
+    future = VimbaObject(None, 1).run_feature_command_async('GVSPAdjustPacketSize')
+    with pytest.raises(VimbaException) as e:
+        future.result(1)
+    assert e.value.error_code == VimbaException.ERR_HANDLE_INVALID
+
+
+def test_run_error(monkeypatch):
+    commands = fake_commands(monkeypatch, 0.0)
+    commands.failing_handles.add(1)
+    with pytest.raises(VimbaException):
+        VimbaObject(None, 1).run_feature_command_async('GVSPAdjustPacketSize')
+
+
+def test_many_objects(monkeypatch):
+    commands = fake_commands(monkeypatch, 0.05)
+    commands.failing_handles.add(3)
+    futures = run_feature_commands_async(list(VimbaObject(None, handle) for handle in range(1, 5)),
+                                         'GVSPAdjustPacketSize', timeout=1)
+
+    # a command failing to start doesn't stop the others
+    assert sorted(commands.run_at) == [1, 2, 4]
+    for handle, future in enumerate(futures, 1):
+        if handle == 3:
+            assert future.exception(1).error_code == VimbaException.ERR_RESOURCE_NOT_AVAILABLE
+        else:
+            assert future.result(1) is None
@@ -0,0 +1,162 @@
+import pytest
+from pymba import VimbaException
+from pymba.feature import Feature, _FEATURE_DATA_INT, _FEATURE_DATA_FLOAT, \
+    _FEATURE_FLAGS_VOLATILE
+from pymba import vimba_c
+
+
+class Limits:
+    # stands in for the camera's range and increment queries, counting them
+
+    def __init__(self, range_, increment):
+        self.range = range_
+        self.increment = increment
+        self.queries = 0
+
+    def query_range(self):
+        self.queries += 1
+        return self.range
+
+    def query_increment(self):
+        if self.increment is None:
+            raise VimbaException(VimbaException.ERR_NOT_IMPLEMENTED_IN_PYMBA)
+        return self.increment
+
+
+class Watch:
+    # stands in for a Vimba object's invalidation listeners
+
+    def __init__(self):
+        self.listeners = []
+
+    def __call__(self, name, listener):
+        self.listeners.append(listener)
+
+    def invalidate(self):
+        for listener in self.listeners:
+            listener('Width')
+
+
+def make_feature(data_type, limits, limit_mode=None, watch=None, flags=3) -> Feature:
+    info = vimba_c.VmbFeatureInfo()
+    info.name = b'Width'
+    info.featureDataType = data_type
+    info.featureFlags = flags
+    feature = Feature('Width', None, info, watch)
+    feature._range_query = limits.query_range
+    feature._increment_query = limits.query_increment
+    feature.limit_mode = limit_mode
+    return feature
+
+
+@pytest.mark.parametrize('value, expected', [
+    (64, 64), (8, 8), (2048, 2048), (0, None), (2056, None), (65, None), (-8, None)])
+def test_check_int(value, expected):
+    feature = make_feature(_FEATURE_DATA_INT, Limits((8, 2048), 8), 'check')
+    assert feature._limit_value(value, (8, 2048), 8) == expected
+
+
+@pytest.mark.parametrize('value, expected', [
+    # clamped to the range
+    (0, 8), (-100, 8), (5000, 2048),
+    # snapped to the nearest increment from the minimum, halfway rounds up
+    (16, 16), (17, 16), (19, 16), (20, 24), (23, 24),
+    # the maximum isn't on the increment grid, so the last step below it is used
+    (2048, 2048), (2045, 2048), (2052, 2048)])
+def test_clamp_int(value, expected):
+    feature = make_feature(_FEATURE_DATA_INT, Limits((8, 2052), 8), 'clamp')
+    assert feature._limit_value(value, (8, 2052), 8) == expected
+
+
+def test_clamp_int_without_increment():
+    feature = make_feature(_FEATURE_DATA_INT, Limits((1, 10), None), 'clamp')
+    assert feature._limit_value(7, (1, 10), None) == 7
+    assert feature._limit_value(11, (1, 10), None) == 10
+
+
+@pytest.mark.parametrize('value, expected', [
+    (10.0, 10.0), (40.0, 40.0), (9.9, None), (40.1, None),
+    # the camera rounds floats to their increment itself
+    (10.03, 10.03)])
+def test_check_float(value, expected):
+    feature = make_feature(_FEATURE_DATA_FLOAT, Limits((10.0, 40.0), 0.1), 'check')
+    assert feature._limit_value(value, (10.0, 40.0), 0.1) == expected
+
+
+@pytest.mark.parametrize('value, expected', [
+    (5.0, 10.0), (50.0, 40.0), (10.04, 10.0), (10.06, 10.1), (39.97, 40.0)])
+def test_clamp_float(value, expected):
+    feature = make_feature(_FEATURE_DATA_FLOAT, Limits((10.0, 40.0), 0.1), 'clamp')
+    assert feature._limit_value(value, (10.0, 40.0), 0.1) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('value', [1.07, 1.2])
+def test_clamp_float_snap_never_exceeds_maximum(value):
+    # snapping would round up to 1.1
+    feature = make_feature(_FEATURE_DATA_FLOAT, Limits((0.0, 1.07), 0.1), 'clamp')
+    assert feature._limit_value(value, (0.0, 1.07), 0.1) == 1.07
+
+
+def test_limits_cached_until_invalidated():
+    limits = Limits((8, 2048), 8)
+    watch = Watch()
+    feature = make_feature(_FEATURE_DATA_INT, limits, watch=watch)
+    assert feature.range == (8, 2048)
+    assert feature.range == (8, 2048)
+    assert limits.queries == 1
+    assert len(watch.listeners) == 1
+
+    limits.range = (16, 1024)
+    assert feature.range == (8, 2048)
+    watch.invalidate()
+    assert feature.range == (16, 1024)
+    assert limits.queries == 2
+
+
+def test_limits_not_cached_without_watch():
+    limits = Limits((8, 2048), 8)
+    feature = make_feature(_FEATURE_DATA_INT, limits)
+    feature.range
+    feature.range
+    assert limits.queries == 2
+
+
+def test_volatile_limits_not_cached():
+    limits = Limits((8, 2048), 8)
+    watch = Watch()
+    feature = make_feature(_FEATURE_DATA_INT, limits, watch=watch,
+                           flags=3 | _FEATURE_FLAGS_VOLATILE)
+    feature.range
+    feature.range
+    assert limits.queries == 2
+    assert watch.listeners == []
+
+
+def test_stale_limits_requeried_before_adjusting():
+    limits = Limits((8, 2048), 8)
+    feature = make_feature(_FEATURE_DATA_INT, limits, 'clamp', watch=Watch())
+    assert feature._limit(64) == 64
+
+    # the cached range would clamp the value, so the range is queried again first
+    limits.range = (8, 4096)
+    assert feature._limit(3000) == 3000
+    assert limits.queries == 2
+
+    # values within the cached limits aren't requeried
+    assert feature._limit(72) == 72
+    assert limits.queries == 2
+
+
+def test_check_rejects_after_requery():
+    limits = Limits((8, 2048), 8)
+    feature = make_feature(_FEATURE_DATA_INT, limits, 'check', watch=Watch())
+    with pytest.raises(VimbaException) as e:
+        feature._limit(4096)
+    assert e.value.error_code == VimbaException.ERR_VALUE_INVALID
+    assert limits.queries == 2
+
+
+def test_invalid_limit_mode():
+    feature = make_feature(_FEATURE_DATA_INT, Limits((8, 2048), 8))
+    with pytest.raises(ValueError):
+        feature.limit_mode = 'round'
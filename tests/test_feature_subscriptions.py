@@ -0,0 +1,124 @@
+import threading
+import time
+import pytest
+from pymba.feature_subscriptions import _FeatureInvalidationHub
+
+
+class FakeVimbaObject:
+    # records the invalidation listeners registered by the hub, which stand in for Vimba callbacks
+
+    def __init__(self):
+        self.listeners = {}
+
+    def _add_feature_invalidation_listener(self, feature_name: str, listener) -> None:
+        assert feature_name not in self.listeners
+        self.listeners[feature_name] = listener
+
+    def _remove_feature_invalidation_listener(self, feature_name: str, listener) -> None:
+        assert self.listeners.pop(feature_name) == listener
+
+    def invalidate(self, feature_name: str) -> None:
+        self.listeners[feature_name](feature_name)
+
+
+class Recorder:
+
+    def __init__(self):
+        self.events = []
+        self.delivered = threading.Event()
+
+    def __call__(self, vimba_object, feature_name: str) -> None:
+        self.events.append((vimba_object, feature_name))
+        self.delivered.set()
+
+
+@pytest.fixture
+def vimba_object() -> FakeVimbaObject:
+    return FakeVimbaObject()
+
+
+@pytest.fixture
+def hub(vimba_object) -> _FeatureInvalidationHub:
+    return _FeatureInvalidationHub(vimba_object)
+
+
+def test_listener_per_feature(hub, vimba_object):
+    first = hub.subscribe(['Width', 'Height'], Recorder(), 0.0)
+    second = hub.subscribe(['Width'], Recorder(), 0.0)
+    assert sorted(vimba_object.listeners) == ['Height', 'Width']
+
+    first.cancel()
+    assert list(vimba_object.listeners) == ['Width']
+
+    # cancelling twice is harmless
+    first.cancel()
+    second.cancel()
+    assert vimba_object.listeners == {}
+
+
+def test_delivery(hub, vimba_object):
+    callbacks = Recorder(), Recorder()
+    for callback in callbacks:
+        hub.subscribe(['Width'], callback, 0.0)
+
+    vimba_object.invalidate('Width')
+    for callback in callbacks:
+        assert callback.delivered.wait(1)
+        assert callback.events == [(vimba_object, 'Width')]
+
+
+def test_debounce_coalesces_events(hub, vimba_object):
+    callback = Recorder()
+    hub.subscribe(['Width', 'Height'], callback, 0.1)
+
+    for _ in range(10):
+        vimba_object.invalidate('Width')
+    vimba_object.invalidate('Height')
+    time.sleep(0.3)
+
+    # repeated events of a feature are delivered once, those of other features separately
+    assert callback.events == [(vimba_object, 'Width'), (vimba_object, 'Height')]
+
+    # events after delivery are delivered again
+    callback.delivered.clear()
+    vimba_object.invalidate('Width')
+    assert callback.delivered.wait(1)
+    assert callback.events[-1] == (vimba_object, 'Width')
+
+
+def test_cancel_drops_queued_events(hub, vimba_object):
+    callback = Recorder()
+    subscription = hub.subscribe(['Width'], callback, 0.1)
+    other_callback = Recorder()
+    hub.subscribe(['Width'], other_callback, 0.1)
+
+    vimba_object.invalidate('Width')
+    subscription.cancel()
+
+    assert other_callback.delivered.wait(1)
+    assert callback.events == []
+
+
+def test_unsubscribe_all_drops_queued_events(hub, vimba_object):
+    callback = Recorder()
+    hub.subscribe(['Width', 'Height'], callback, 0.1)
+
+    vimba_object.invalidate('Width')
+    hub.unsubscribe_all()
+    assert vimba_object.listeners == {}
+
+    time.sleep(0.3)
+    assert callback.events == []
+
+
+def test_failing_callback(hub, vimba_object):
+    def fail(vimba_object, feature_name):
+        raise RuntimeError
+
+    hub.subscribe(['Width'], fail, 0.0)
+    callback = Recorder()
+    hub.subscribe(['Width'], callback, 0.05)
+
+    # the dispatcher carries on delivering after a callback raises
+    vimba_object.invalidate('Width')
+    assert callback.delivered.wait(1)
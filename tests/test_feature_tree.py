@@ -0,0 +1,102 @@
+import pytest
+from pymba import VimbaException
+from pymba.feature_tree import FeatureTree, FEATURE_VISIBILITY_BEGINNER, \
+    FEATURE_VISIBILITY_EXPERT, FEATURE_VISIBILITY_GURU
+from pymba import vimba_c
+
+
+FEATURES = [
+    # name, category, visibility
+    ('Width', '/ImageFormat/ROI', FEATURE_VISIBILITY_BEGINNER),
+    ('Height', '/ImageFormat/ROI', FEATURE_VISIBILITY_BEGINNER),
+    ('OffsetX', '/ImageFormat/ROI', FEATURE_VISIBILITY_EXPERT),
+    ('PixelFormat', '/ImageFormat', FEATURE_VISIBILITY_BEGINNER),
+    ('ImageSize', '/ImageMode', FEATURE_VISIBILITY_GURU),
+    ('AcquisitionMode', '/AcquisitionControl', FEATURE_VISIBILITY_BEGINNER),
+    ('AcquisitionStart', '/AcquisitionControl', FEATURE_VISIBILITY_BEGINNER),
+    ('AcquisitionFrameRate', '/AcquisitionControl', FEATURE_VISIBILITY_EXPERT),
+    ('ActionDeviceKey', '/ActionControl', FEATURE_VISIBILITY_GURU),
+    ('GVSPPacketSize', '/GigE/Stream/Packets', FEATURE_VISIBILITY_GURU),
+]
+
+
+@pytest.fixture
+def tree() -> FeatureTree:
+    feature_infos = {}
+    for name, category, visibility in FEATURES:
+        info = vimba_c.VmbFeatureInfo()
+        info.name = name.encode()
+        info.category = category.encode()
+        info.visibility = visibility
+        feature_infos[name] = info
+    return FeatureTree(feature_infos)
+
+
+def test_names(tree):
+    assert len(tree) == len(FEATURES)
+    assert list(tree) == sorted(name for name, _, _ in FEATURES)
+    assert 'Width' in tree
+    assert 'Depth' not in tree
+    assert tree.info('Width').category == b'/ImageFormat/ROI'
+    with pytest.raises(VimbaException):
+        tree.info('Depth')
+
+
+@pytest.mark.parametrize('prefix, expected', [
+    ('Acquisition', ['AcquisitionFrameRate', 'AcquisitionMode', 'AcquisitionStart']),
+    ('Ac', ['AcquisitionFrameRate', 'AcquisitionMode', 'AcquisitionStart', 'ActionDeviceKey']),
+    ('AcquisitionMode', ['AcquisitionMode']),
+    ('AcquisitionModes', []),
+    ('Z', []),
+    ('', sorted(name for name, _, _ in FEATURES))])
+def test_names_with_prefix(tree, prefix, expected):
+    assert tree.names_with_prefix(prefix) == expected
+
+
+def test_visibility(tree):
+    assert tree.names(FEATURE_VISIBILITY_BEGINNER) == [
+        'AcquisitionMode', 'AcquisitionStart', 'Height', 'PixelFormat', 'Width']
+    assert tree.names_with_prefix('Acquisition', FEATURE_VISIBILITY_BEGINNER) == [
+        'AcquisitionMode', 'AcquisitionStart']
+    assert tree.category_names('/ImageFormat', recursive=True,
+                               max_visibility=FEATURE_VISIBILITY_EXPERT) == [
+        'PixelFormat', 'Width', 'Height', 'OffsetX']
+
+
+def test_categories(tree):
+    # categories that only hold subcategories are included
+    assert tree.categories() == [
+        '/', '/AcquisitionControl', '/ActionControl', '/GigE', '/GigE/Stream',
+        '/GigE/Stream/Packets', '/ImageFormat', '/ImageFormat/ROI', '/ImageMode']
+    assert tree.categories('/Image') == ['/ImageFormat', '/ImageFormat/ROI', '/ImageMode']
+
+
+def test_subcategories(tree):
+    assert tree.subcategories('/') == [
+        '/AcquisitionControl', '/ActionControl', '/GigE', '/ImageFormat', '/ImageMode']
+    assert tree.subcategories('/GigE') == ['/GigE/Stream']
+    assert tree.subcategories('/GigE/') == ['/GigE/Stream']
+    assert tree.subcategories('/ImageFormat/ROI') == []
+    assert tree.subcategories('/Missing') == []
+
+
+def test_category_names(tree):
+    assert tree.category_names('/ImageFormat') == ['PixelFormat']
+    assert tree.category_names('/ImageFormat/ROI') == ['Width', 'Height', 'OffsetX']
+    assert tree.category_names('/GigE') == []
+    assert tree.category_names('/Missing') == []
+
+
+@pytest.mark.parametrize('category, expected', [
+    ('/ImageFormat', ['PixelFormat', 'Width', 'Height', 'OffsetX']),
+    ('/ImageFormat/', ['PixelFormat', 'Width', 'Height', 'OffsetX']),
+    # a category sharing a prefix with a sibling doesn't include it
+    ('/Image', []),
+    ('/GigE', ['GVSPPacketSize']),
+    ('/ImageFormat/ROI', ['Width', 'Height', 'OffsetX'])])
+def test_category_names_recursive(tree, category, expected):
+    assert tree.category_names(category, recursive=True) == expected
+
+
+def test_category_names_recursive_root(tree):
+    assert sorted(tree.category_names('/', recursive=True)) == sorted(tree)
@@ -0,0 +1,89 @@
+import mmap
+import pytest
+from pymba.frame_allocator import FrameAllocator, DefaultFrameAllocator, MmapFrameAllocator, \
+    UserFrameAllocator, FrameBufferPool
+
+
+class CountingAllocator(FrameAllocator):
+
+    def __init__(self):
+        self.sizes = []
+
+    def allocate(self, size: int):
+        self.sizes.append(size)
+        return bytearray(size)
+
+
+def test_default_allocator():
+    buffer = DefaultFrameAllocator().allocate(100)
+    assert memoryview(buffer).nbytes >= 100
+    assert bytes(buffer)[:100] == bytes(100)
+
+
+@pytest.mark.parametrize('huge_pages', [False, True])
+def test_mmap_allocator(huge_pages):
+    buffer = MmapFrameAllocator(huge_pages).allocate(mmap.PAGESIZE + 1)
+    # whole pages are usable
+    assert len(buffer) == 2 * mmap.PAGESIZE
+
+
+def test_user_allocator():
+    buffers = [bytearray(100), bytearray(200)]
+    allocator = UserFrameAllocator(buffers)
+    assert not allocator.pooled
+    assert allocator.allocate(100) is buffers[0]
+    assert allocator.allocate(100) is buffers[1]
+    with pytest.raises(ValueError):
+        allocator.allocate(100)
+
+    assert UserFrameAllocator([], pooled=True).pooled
+
+
+def test_user_allocator_buffer_too_small():
+    with pytest.raises(ValueError):
+        UserFrameAllocator([bytearray(99)]).allocate(100)
+
+
+def test_pool_reuses_released_buffers():
+    allocator = CountingAllocator()
+    pool = FrameBufferPool(allocator)
+    assert pool.allocator is allocator
+
+    buffers = [pool.allocate(100) for _ in range(3)]
+    assert allocator.sizes == [100] * 3
+    for buffer in buffers:
+        pool.release(buffer, 100)
+
+    reused = [pool.allocate(100) for _ in range(3)]
+    assert allocator.sizes == [100] * 3
+    assert sorted(map(id, reused)) == sorted(map(id, buffers))
+
+    # only new buffers are allocated once the free ones are used up
+    pool.allocate(100)
+    assert allocator.sizes == [100] * 4
+
+
+def test_pool_keyed_by_size():
+    allocator = CountingAllocator()
+    pool = FrameBufferPool(allocator)
+    buffer = pool.allocate(100)
+    pool.release(buffer, 100)
+
+    assert pool.allocate(200) is not buffer
+    assert allocator.sizes == [100, 200]
+    assert pool.allocate(100) is buffer
+
+
+def test_pool_clear():
+    allocator = CountingAllocator()
+    pool = FrameBufferPool(allocator)
+    pool.release(pool.allocate(100), 100)
+    pool.clear()
+    pool.allocate(100)
+    assert allocator.sizes == [100, 100]
+
+
+def test_pool_default_allocator():
+    pool = FrameBufferPool()
+    assert isinstance(pool.allocator, DefaultFrameAllocator)
+    assert memoryview(pool.allocate(100)).nbytes >= 100
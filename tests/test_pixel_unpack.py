@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from pymba.vimba_pixelformat import VmbPixelFormat
+from pymba.pixel_unpack import PACKED_PIXELFORMAT_UNPACKERS, unpack_10p, unpack_12p, \
+    unpack_12packed
+
+
+def pack_lsb_first(pixels, bits: int) -> np.ndarray:
+    # PFNC p formats, pixels are a continuous stream of bits filling each byte from its lsb
+    stream = 0
+    for i, pixel in enumerate(pixels):
+        stream |= int(pixel) << (i * bits)
+    num_bytes = -(-len(pixels) * bits // 8)
+    return np.frombuffer(stream.to_bytes(num_bytes, 'little'), dtype=np.uint8)
+
+
+def pack_12packed(pixels) -> np.ndarray:
+    # GigE Vision 12Packed, the 8 msbs of each pixel of a pair surround a byte of their 4 lsbs
+    packed = []
+    for i in range(0, len(pixels), 2):
+        p0 = int(pixels[i])
+        p1 = int(pixels[i + 1]) if i + 1 < len(pixels) else 0
+        packed.append(p0 >> 4)
+        packed.append((p0 & 0x0F) | ((p1 & 0x0F) << 4))
+        if i + 1 < len(pixels):
+            packed.append(p1 >> 4)
+    return np.array(packed, dtype=np.uint8)
+
+
+UNPACKERS = [
+    (unpack_10p, 10, lambda pixels: pack_lsb_first(pixels, 10)),
+    (unpack_12p, 12, lambda pixels: pack_lsb_first(pixels, 12)),
+    (unpack_12packed, 12, pack_12packed),
+]
+
+
+@pytest.mark.parametrize('unpack, bits, pack', UNPACKERS)
+@pytest.mark.parametrize('num_pixels', [1, 2, 3, 4, 5, 7, 8, 640])
+def test_unpack(unpack, bits, pack, num_pixels):
+    pixels = np.random.RandomState(num_pixels).randint(0, 1 << bits, num_pixels, dtype=np.uint16)
+    unpacked = unpack(pack(pixels), num_pixels)
+    assert unpacked.dtype == np.uint16
+    np.testing.assert_array_equal(unpacked, pixels)
+
+
+@pytest.mark.parametrize('unpack, bits, pack', UNPACKERS)
+def test_unpack_extremes(unpack, bits, pack):
+    pixels = np.array([0, (1 << bits) - 1, 1, 1 << (bits - 1)] * 4, dtype=np.uint16)
+    np.testing.assert_array_equal(unpack(pack(pixels), pixels.size), pixels)
+
+
+def test_reference_bit_layouts():
+    # Mono10p, pixels 0x3FF, 0x000, 0x155, 0x2AA
+    np.testing.assert_array_equal(
+        unpack_10p(np.array([0xFF, 0x03, 0x50, 0x95, 0xAA], dtype=np.uint8), 4),
+        [0x3FF, 0x000, 0x155, 0x2AA])
+    # Mono12p, pixels 0xABC, 0x123
+    np.testing.assert_array_equal(
+        unpack_12p(np.array([0xBC, 0x3A, 0x12], dtype=np.uint8), 2), [0xABC, 0x123])
+    # Mono12Packed, pixels 0xABC, 0x123
+    np.testing.assert_array_equal(
+        unpack_12packed(np.array([0xAB, 0x3C, 0x12], dtype=np.uint8), 2), [0xABC, 0x123])
+
+
+@pytest.mark.parametrize('unpack, bits, pack', UNPACKERS)
+@pytest.mark.parametrize('shape', [(4, 8), (3, 5)])
+def test_unpack_out(unpack, bits, pack, shape):
+    pixels = np.random.RandomState(0).randint(0, 1 << bits, shape, dtype=np.uint16)
+    out = np.zeros(shape, dtype=np.uint16)
+    assert unpack(pack(pixels.ravel()), pixels.size, out) is out
+    np.testing.assert_array_equal(out, pixels)
+
+
+@pytest.mark.parametrize('out', [np.zeros(7, dtype=np.uint16),
+                                 np.zeros(8, dtype=np.uint8),
+                                 np.zeros((4, 4), dtype=np.uint16)[:, ::2]])
+def test_unpack_out_invalid(out):
+    with pytest.raises(ValueError):
+        unpack_12p(np.zeros(12, dtype=np.uint8), 8, out)
+
+
+def test_packed_pixel_formats():
+    # every packed format in VmbPixelFormat has an unpacker, names ending in p or Packed
+    packed = {value for name, value in VmbPixelFormat.__members__.items()
+              if name.endswith('p') or name.endswith('Packed')}
+    assert packed == set(PACKED_PIXELFORMAT_UNPACKERS)
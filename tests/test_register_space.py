@@ -0,0 +1,218 @@
+import random
+import pytest
+from pymba import VimbaException
+from pymba.vimba_object import VimbaObject
+from pymba.register_space import RegisterSpace
+from pymba import vimba_c
+
+
+class FakeMemory:
+    # stands in for the Vimba C memory functions of a camera, recording each block transfer
+
+    def __init__(self, size: int):
+        self.memory = bytearray(random.Random(size).getrandbits(8) for _ in range(size))
+        self.reads = []
+        self.writes = []
+        # transfers larger than this are only partially completed
+        self.max_transfer = None
+
+    def _transfer_size(self, size: int) -> int:
+        return size if self.max_transfer is None else min(size, self.max_transfer)
+
+    def vmb_memory_read(self, handle, address: int, size: int, buffer, size_complete) -> int:
+        self.reads.append((address, size))
+        size = self._transfer_size(size)
+        buffer[:size] = bytes(self.memory[address:address + size])
+        size_complete._obj.value = size
+        return 0
+
+    def vmb_memory_write(self, handle, address: int, size: int, data: bytes,
+                         size_complete) -> int:
+        self.writes.append((address, bytes(data)))
+        size = self._transfer_size(size)
+        self.memory[address:address + size] = data[:size]
+        size_complete._obj.value = size
+        return 0
+
+
+def fake_camera(monkeypatch, memory: FakeMemory) -> VimbaObject:
+    monkeypatch.setattr(vimba_c, 'vmb_memory_read', memory.vmb_memory_read)
+    monkeypatch.setattr(vimba_c, 'vmb_memory_write', memory.vmb_memory_write)
+    return VimbaObject(None, 1)
+
+
+@pytest.fixture
+def memory() -> FakeMemory:
+    return FakeMemory(0x1000)
+
+
+@pytest.fixture
+def camera(monkeypatch, memory) -> VimbaObject:
+    return fake_camera(monkeypatch, memory)
+
+
+def test_read(memory, camera):
+    space = RegisterSpace(camera, 0x100, 0x800, page_size=0x100)
+    assert len(space) == 0x800
+    assert bytes(space) == memory.memory[0x100:0x900]
+    assert space[5] == memory.memory[0x105]
+    assert space[-1] == memory.memory[0x8FF]
+    with pytest.raises(IndexError):
+        space[0x800]
+    with pytest.raises(IndexError):
+        space.read(0x7FF, 2)
+
+
+def test_pages_cached(memory, camera):
+    space = RegisterSpace(camera, 0, 0x400, page_size=0x100)
+    space[0x10:0x20]
+    space[0x80]
+    assert memory.reads == [(0, 0x100)]
+
+    # missing pages are read in a single transfer, cached ones aren't read again
+    space[0x50:0x350]
+    assert memory.reads == [(0, 0x100), (0x100, 0x300)]
+
+
+def test_last_page_truncated(memory, camera):
+    space = RegisterSpace(camera, 0, 0x180, page_size=0x100)
+    assert space[0x170:0x180] == memory.memory[0x170:0x180]
+    assert memory.reads == [(0x100, 0x80)]
+
+
+def test_pages_evicted(memory, camera):
+    space = RegisterSpace(camera, 0, 0x400, page_size=0x100, max_cached_pages=2)
+    space[0x000]
+    space[0x100]
+    space[0x000]
+    space[0x200]
+    del memory.reads[:]
+
+    # the least recently used page was evicted
+    space[0x000]
+    space[0x200]
+    assert memory.reads == []
+    space[0x100]
+    assert memory.reads == [(0x100, 0x100)]
+
+    # a read larger than the cache still succeeds
+    assert space[:] == memory.memory[:0x400]
+
+
+@pytest.mark.parametrize('key', [
+    slice(None, None, 2), slice(3, 300, 7), slice(None, None, -1), slice(300, 3, -7),
+    slice(-1, -20, -3), slice(10, 5), slice(5, 10, -1), slice(-5, None)])
+def test_slices(memory, camera, key):
+    space = RegisterSpace(camera, 0x40, 0x200, page_size=0x80)
+    assert space[key] == bytes(memory.memory[0x40:0x240][key])
+
+
+def test_writes_buffered(memory, camera):
+    space = RegisterSpace(camera, 0x100, 0x200, page_size=0x100)
+    before = bytes(space[0x10:0x20])
+    space[0x10:0x14] = b'\x01\x02\x03\x04'
+    space[0x12] = 0xFF
+
+    # pending writes are visible to reads but not yet sent
+    assert space[0x10:0x20] == b'\x01\x02\xFF\x04' + before[4:]
+    assert memory.writes == []
+
+    space.flush()
+    assert memory.writes == [(0x110, b'\x01\x02\xFF\x04')]
+    assert memory.memory[0x110:0x114] == b'\x01\x02\xFF\x04'
+
+
+def test_flush_coalesces(memory, camera):
+    space = RegisterSpace(camera, 0, 0x400, page_size=0x100)
+    space.write(0x20, b'\xAA' * 8)
+    # adjacent
+    space.write(0x28, b'\xBB' * 8)
+    # overlapping, later writes take precedence
+    space.write(0x24, b'\xCC' * 8)
+    # separate
+    space.write(0x300, b'\xDD' * 2)
+    # earlier than and overlapping the first block
+    space.write(0x1C, b'\xEE' * 6)
+    space.flush()
+
+    assert memory.writes == [
+        (0x1C, b'\xEE' * 6 + b'\xAA' * 2 + b'\xCC' * 8 + b'\xBB' * 4),
+        (0x300, b'\xDD' * 2)]
+
+
+def test_flush_refreshes_pages(memory, camera):
+    space = RegisterSpace(camera, 0, 0x400, page_size=0x100)
+    space[0x000]
+    space[0x200]
+    space[0x010] = 0x42
+    space.flush()
+    del memory.reads[:]
+
+    # the written page is read again, others stay cached
+    assert space[0x010] == 0x42
+    space[0x200]
+    assert memory.reads == [(0, 0x100)]
+
+
+def test_context_manager_flushes(memory, camera):
+    with RegisterSpace(camera, 0, 0x100) as space:
+        space[0:2] = b'\x01\x02'
+        assert memory.writes == []
+    assert memory.writes == [(0, b'\x01\x02')]
+
+
+@pytest.mark.parametrize('key, value', [
+    (slice(0, 4, 2), b'\x00\x00'), (slice(0, 4), b'\x00'), (slice(0x1FF, 0x201), b'\x00\x00')])
+def test_invalid_writes(memory, camera, key, value):
+    space = RegisterSpace(camera, 0, 0x200)
+    with pytest.raises(ValueError):
+        space[key] = value
+
+
+def test_random_access_matches_memory(monkeypatch):
+    memory = FakeMemory(0x800)
+    camera = fake_camera(monkeypatch, memory)
+    expected = bytearray(memory.memory[0x100:0x700])
+    space = RegisterSpace(camera, 0x100, 0x600, page_size=0x40, max_cached_pages=4)
+    rng = random.Random(0)
+    for _ in range(500):
+        offset = rng.randrange(0x600)
+        size = rng.randrange(0x600 - offset + 1)
+        if rng.random() < 0.5:
+            data = bytes(rng.getrandbits(8) for _ in range(min(size, 0x20)))
+            space.write(offset, data)
+            expected[offset:offset + len(data)] = data
+        else:
+            assert space.read(offset, size) == expected[offset:offset + size]
+        if rng.random() < 0.1:
+            space.flush()
+    space.flush()
+    assert memory.memory[0x100:0x700] == expected
+
+
+def test_short_read(memory, camera):
+    space = RegisterSpace(camera, 0, 0x400, page_size=0x100)
+    memory.max_transfer = 0x80
+    with pytest.raises(VimbaException) as e:
+        space[0x10]
+    assert e.value.error_code == VimbaException.ERR_PARTIAL_REGISTER_ACCESS
+
+    # the partially read page isn't cached
+    memory.max_transfer = None
+    assert space[0x90] == memory.memory[0x90]
+    assert memory.reads == [(0, 0x100), (0, 0x100)]
+
+
+def test_short_write(memory, camera):
+    space = RegisterSpace(camera, 0, 0x400, page_size=0x100)
+    space[0x10:0x20] = bytes(range(16))
+    memory.max_transfer = 8
+    with pytest.raises(VimbaException) as e:
+        space.flush()
+    assert e.value.error_code == VimbaException.ERR_PARTIAL_REGISTER_ACCESS
+
+    # the write is kept and sent again by the next flush
+    memory.max_transfer = None
+    space.flush()
+    assert memory.memory[0x10:0x20] == bytes(range(16))
+    assert len(memory.writes) == 2
@@ -0,0 +1,163 @@
+from typing import Callable, Dict, List, Optional
+import pytest
+from pymba import VimbaException
+from pymba.vimba_object import VimbaObject
+from pymba.feature import _FEATURE_DATA_INT, _FEATURE_FLAGS_READ, _FEATURE_FLAGS_WRITE
+from pymba import vimba_c
+
+
+class FakeDevice:
+    # stands in for the Vimba C int feature functions of a camera, recording each write
+
+    def __init__(self, values: Dict[str, int], affected: Dict[str, List[str]],
+                 valid: Callable[[Dict[str, int]], bool],
+                 on_write: Optional[Callable[[str, Dict[str, int]], None]] = None):
+        self.values = values
+        self.affected = affected
+        self.valid = valid
+        self.on_write = on_write
+        self.writes = []
+
+    def vmb_feature_int_get(self, handle, name: bytes, value) -> int:
+        value._obj.value = self.values[name.decode()]
+        return 0
+
+    def vmb_feature_int_set(self, handle, name: bytes, value: int) -> int:
+        name = name.decode()
+        values = dict(self.values, **{name: value})
+        if self.on_write is not None:
+            self.on_write(name, values)
+        if not self.valid(values):
+            return VimbaException.ERR_VALUE_INVALID
+        self.writes.append((name, value))
+        self.values = values
+        return 0
+
+    def vmb_feature_list_affected(self, handle, name: bytes, infos, size: int, num_found,
+                                  info_size: int) -> int:
+        affected = self.affected.get(name.decode(), [])
+        num_found._obj.value = len(affected)
+        for i, affected_name in enumerate(affected[:size]):
+            infos[i].name = affected_name.encode()
+        return 0
+
+    def vmb_feature_list_selected(self, handle, name: bytes, infos, size: int, num_found,
+                                  info_size: int) -> int:
+        num_found._obj.value = 0
+        return 0
+
+
+def fake_camera(monkeypatch, device: FakeDevice) -> VimbaObject:
+    for func in ('vmb_feature_int_get', 'vmb_feature_int_set', 'vmb_feature_list_affected',
+                 'vmb_feature_list_selected'):
+        monkeypatch.setattr(vimba_c, func, getattr(device, func))
+
+    camera = VimbaObject(None, 1)
+    camera._feature_info_index = {}
+    for name in device.values:
+        info = vimba_c.VmbFeatureInfo()
+        info.name = name.encode()
+        info.featureDataType = _FEATURE_DATA_INT
+        info.featureFlags = _FEATURE_FLAGS_READ | _FEATURE_FLAGS_WRITE
+        info.hasAffectedFeatures = name in device.affected
+        camera._feature_info_index[name] = info
+    return camera
+
+
+def valid_roi(values: Dict[str, int]) -> bool:
+    # a 2048 pixel wide sensor whose usable width is divided by the binning
+    max_width = 2048 // values['BinningHorizontal']
+    return 0 < values['Width'] <= max_width and values['OffsetX'] + values['Width'] <= max_width
+
+
+def reset_roi(name: str, values: Dict[str, int]) -> None:
+    # like many cameras, changing the binning resets the region of interest to the full sensor
+    if name == 'BinningHorizontal':
+        values['Width'] = 2048 // values['BinningHorizontal']
+        values['OffsetX'] = 0
+
+
+ROI_AFFECTED = {'BinningHorizontal': ['Width', 'OffsetX'], 'Width': ['OffsetX']}
+
+
+@pytest.fixture
+def device() -> FakeDevice:
+    return FakeDevice({'OffsetX': 0, 'Width': 2048, 'BinningHorizontal': 1}, ROI_AFFECTED,
+                      valid_roi, reset_roi)
+
+
+@pytest.fixture
+def camera(monkeypatch, device) -> VimbaObject:
+    return fake_camera(monkeypatch, device)
+
+
+def test_write_order(camera):
+    assert camera._feature_write_order(['OffsetX', 'Width', 'BinningHorizontal']) == \
+        ['BinningHorizontal', 'Width', 'OffsetX']
+    assert camera._feature_write_order(['Width', 'OffsetX']) == ['Width', 'OffsetX']
+    assert camera._feature_write_order(['OffsetX', 'Width']) == ['Width', 'OffsetX']
+
+
+def test_write_order_cycle(monkeypatch):
+    # features affecting each other keep the given order
+    device = FakeDevice({'A': 0, 'B': 0, 'C': 0}, {'A': ['B'], 'B': ['A'], 'C': ['A']},
+                        lambda values: True)
+    camera = fake_camera(monkeypatch, device)
+    assert camera._feature_write_order(['B', 'A', 'C']) == ['C', 'B', 'A']
+    assert camera._feature_write_order(['A', 'B']) == ['A', 'B']
+    assert camera._feature_write_order(['B', 'A']) == ['B', 'A']
+
+
+def test_set_features_in_dependency_order(camera, device):
+    camera.set_features({'OffsetX': 256, 'Width': 512, 'BinningHorizontal': 2})
+    assert device.writes == [('BinningHorizontal', 2), ('Width', 512), ('OffsetX', 256)]
+    assert device.values == {'OffsetX': 256, 'Width': 512, 'BinningHorizontal': 2}
+
+
+def test_unchanged_values_skipped(camera, device):
+    camera.set_features({'OffsetX': 0, 'Width': 2048, 'BinningHorizontal': 1})
+    assert device.writes == []
+
+    camera.set_features({'Width': 1024, 'BinningHorizontal': 1})
+    assert device.writes == [('Width', 1024)]
+
+
+def test_failed_write_retried(monkeypatch):
+    # without dependency info the offset is written first and only fits once the width is smaller
+    device = FakeDevice({'OffsetX': 0, 'Width': 2048, 'BinningHorizontal': 1}, {}, valid_roi)
+    camera = fake_camera(monkeypatch, device)
+    camera.set_features({'OffsetX': 1024, 'Width': 1024})
+    assert device.writes == [('Width', 1024), ('OffsetX', 1024)]
+    assert device.values['OffsetX'] == 1024
+
+
+def test_affected_features_read_again(monkeypatch):
+    device = FakeDevice({'OffsetX': 0, 'Width': 512, 'BinningHorizontal': 2}, ROI_AFFECTED,
+                        valid_roi, reset_roi)
+    camera = fake_camera(monkeypatch, device)
+
+    # the width is already 512 but writing the binning resets it, so it must be written again
+    camera.set_features({'BinningHorizontal': 1, 'Width': 512})
+    assert device.writes == [('BinningHorizontal', 1), ('Width', 512)]
+    assert device.values['Width'] == 512
+
+
+def test_rollback(camera, device):
+    with pytest.raises(VimbaException) as e:
+        camera.set_features({'BinningHorizontal': 2, 'Width': 1500})
+    assert e.value.error_code == VimbaException.ERR_VALUE_INVALID
+
+    # the binning was written and then restored
+    assert device.writes == [('BinningHorizontal', 2), ('BinningHorizontal', 1)]
+    assert device.values['BinningHorizontal'] == 1
+
+
+def test_rollback_in_reverse_order(camera, device):
+    with pytest.raises(VimbaException):
+        camera.set_features({'BinningHorizontal': 2, 'Width': 512, 'OffsetX': 1024})
+
+    # the offset never fitted so isn't restored, the full width only fits once the binning is
+    # restored so is retried after it
+    assert device.writes == [('BinningHorizontal', 2), ('Width', 512),
+                             ('BinningHorizontal', 1), ('Width', 2048)]
+    assert device.values == {'OffsetX': 0, 'Width': 2048, 'BinningHorizontal': 1}